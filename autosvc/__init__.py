@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
-
 
 def __getattr__(name: str) -> str:
     if name != "__version__":
         raise AttributeError(name)
+    # importlib.metadata is slow to import; only pay for it when the version is asked for.
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("autosvc")
     except PackageNotFoundError:
         return "0.0.0"
-
@@ -1,31 +1,76 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import logging
-import socket
 import sys
-import uuid
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import os
+import re
 
-from autosvc.config import ensure_dirs, load_dirs
-from autosvc.runlog import TeeTextIO, create_run_log_dir
-from autosvc.unsafe import prompt_password
+from autosvc.config import AutosvcDirs, ensure_dirs, load_dirs
+from autosvc.logging import TRACE_LEVEL, LazyTraceId, parse_log_level, setup_logging, trace_context
 
-from autosvc.core.service import DiagnosticService
-from autosvc.core.live.watch import WatchItem, Watcher
-from autosvc.core.safety.confirm import confirm_or_raise
-from autosvc.core.transport.socketcan import SocketCanTransport
-from autosvc.core.uds.did import parse_did
-from autosvc.core.vehicle.discovery import DiscoveryConfig
-from autosvc.ipc.unix_client import UnixJsonlClient
-from autosvc.logging import TRACE_LEVEL, parse_log_level, setup_logging, trace_context
+if TYPE_CHECKING:
+    from autosvc.core.live.watch import WatchItem
+    from autosvc.core.service import DiagnosticService
+    from autosvc.core.transport.socketcan import SocketCanTransport
+    from autosvc.core.vehicle.discovery import DiscoveryConfig
+    from autosvc.ipc.unix_client import UnixJsonlClient
 
 
 log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+_ArgAdder = Callable[[argparse.ArgumentParser], None]
+
+_CAN_ID_MODE_CHOICES = ("11bit", "29bit")
+_ADDRESSING_CHOICES = ("functional", "physical", "both")
+_LOG_LEVEL_CHOICES = ("error", "warning", "info", "debug", "trace")
+_LOG_FORMAT_CHOICES = ("pretty", "json")
+_EMIT_CHOICES = ("changed", "always")
+_WRITE_MODE_CHOICES = ("safe", "advanced", "unsafe")
+_RAW_WRITE_MODE_CHOICES = ("unsafe",)
+_BOOL_OPT = argparse.BooleanOptionalAction
+
+# One "ECU:DID" entry of a comma-separated --items list (DID is None when ":" is missing).
+_WATCH_ITEM_RE = re.compile(r"(?:^|,)\s*([^,:]*?)\s*(?::\s*([^,]*?)\s*)?(?=,|$)")
+
+# Daemon watch events are encoded like _COMPACT_ENCODE output, so this only matches live_did lines.
+_LIVE_DID_MARKER = b'"event":"live_did"'
+
+# Upper bound for a single unterminated JSONL line from the daemon while watching.
+_WATCH_MAX_LINE = 1 << 20
+
+# Kernel socket buffer sizes for the CAN socket in in-process mode (absorbs bursts).
+_CAN_RCVBUF = 1 << 20
+_CAN_SNDBUF = 1 << 18
+
+# Shared compact encoder for JSONL lines (watch output and requests).
+_COMPACT_ENCODE = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+# For dicts already built in sorted key order (LiveDidEvent.to_dict); skips the per-event sort.
+_EVENT_ENCODE = json.JSONEncoder(separators=(",", ":")).encode
+
+# (cmd, subcommand) pairs that may create files under the config/cache dirs.
+_WRITING_COMMANDS = frozenset(
+    {
+        ("backup", "did"),
+        ("unsafe", "set-password"),
+        ("adapt", "backup"),
+        ("adapt", "write"),
+        ("adapt", "write-raw"),
+        ("adapt", "revert"),
+        ("coding", "backup"),
+        ("coding", "write"),
+        ("coding", "write-raw"),
+        ("coding", "revert"),
+    }
+)
+
 
 def _redact_sensitive_argv(argv: list[str]) -> list[str]:
     out: list[str] = []
@@ -49,9 +94,76 @@ def _redact_sensitive_argv(argv: list[str]) -> list[str]:
     return out
 
 
-def main(argv: list[str] | None = None) -> None:
-    parser = argparse.ArgumentParser(prog="autosvc", description="Automotive service diagnostics (CLI/TUI/daemon).")
-    _add_logging_args(parser)
+def main(argv: list[str] | None = None) -> int:
+    # Two-phase parse: resolve the subcommand first, then build only its parser.
+    pre_args, _ = _build_parser(None).parse_known_args(argv)
+    parser = _build_parser(pre_args.cmd)
+    args = parser.parse_args(argv)
+
+    _apply_dir_overrides(args)
+    ns = vars(args)
+
+    # Ensure base dirs exist early, but only for commands that write to them
+    # (unsafe password, backup store, run log bundles).
+    if ns.get("log_dir") or (args.cmd, ns.get(f"{args.cmd}_cmd")) in _WRITING_COMMANDS:
+        ensure_dirs(_dirs())
+
+    # Logging (stderr/file). Keep command results on stdout.
+    level_name: str | None = ns.get("log_level")
+    if ns.get("trace"):
+        level = TRACE_LEVEL
+    elif ns.get("verbose"):
+        level = logging.DEBUG
+    else:
+        level = parse_log_level(level_name)
+
+    trace_id = LazyTraceId()
+
+    log_file = ns.get("log_file")
+    runlog = None
+    result_fh = None
+    stdout_orig = sys.stdout
+    try:
+        if ns.get("log_dir"):
+            from autosvc.runlog import TeeTextIO, create_run_log_dir
+
+            argv_for_meta = [parser.prog] + (list(argv) if argv is not None else sys.argv[1:])
+            argv_for_meta = _redact_sensitive_argv(argv_for_meta)
+            runlog = create_run_log_dir(str(args.log_dir), trace_id=str(trace_id), argv=argv_for_meta)
+            if not log_file:
+                log_file = str(runlog.log_path)
+            result_fh = open(runlog.result_path, "wb")
+            sys.stdout = TeeTextIO(sys.stdout, result_fh)
+
+        setup_logging(
+            level=level,
+            log_format=str(ns.get("log_format") or "pretty"),
+            log_file=log_file,
+            no_color=bool(ns.get("no_color")),
+        )
+
+        with trace_context(trace_id):
+            if log.isEnabledFor(logging.DEBUG):
+                # trace_id is attached by the logging context filter.
+                log.debug("CLI start", extra={"cmd": args.cmd})
+            return _dispatch(args)
+    finally:
+        if result_fh is not None:
+            sys.stdout.flush()
+        sys.stdout = stdout_orig
+        if result_fh is not None:
+            result_fh.flush()
+            result_fh.close()
+
+
+@lru_cache(maxsize=None)
+def _build_parser(cmd: str | None) -> argparse.ArgumentParser:
+    # Cached per selected command so repeated main() calls in one process skip the rebuild.
+    parser = argparse.ArgumentParser(
+        prog="autosvc",
+        description="Automotive service diagnostics (CLI/TUI/daemon).",
+        parents=_parents(_add_logging_args),
+    )
     _add_dir_args(parser)
     parser.add_argument(
         "--connect",
@@ -61,75 +173,67 @@ def main(argv: list[str] | None = None) -> None:
     )
 
     sub = parser.add_subparsers(dest="cmd", required=True)
+    for name, (help_text, adders, build) in _COMMANDS.items():
+        if name == cmd:
+            cmd_p = sub.add_parser(name, help=help_text, parents=_parents(*adders))
+            if build is not None:
+                build(cmd_p)
+        else:
+            sub.add_parser(name, help=help_text, add_help=False)
+    return parser
 
-    scan_p = sub.add_parser("scan", help="Scan ECUs")
-    _add_logging_args(scan_p)
-    _add_can_args(scan_p)
-    _add_connect_arg(scan_p)
-    _add_discovery_args(scan_p)
 
-    dtc_p = sub.add_parser("dtc", help="DTC operations")
-    dtc_sub = dtc_p.add_subparsers(dest="dtc_cmd", required=True)
+def _build_dtc_parser(parser: argparse.ArgumentParser) -> None:
+    dtc_sub = parser.add_subparsers(dest="dtc_cmd", required=True)
 
-    dtc_read_p = dtc_sub.add_parser("read", help="Read DTCs")
-    _add_logging_args(dtc_read_p)
+    dtc_read_p = dtc_sub.add_parser("read", help="Read DTCs", parents=_ecu_parents())
     dtc_read_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 01)")
     dtc_read_p.add_argument(
         "--with-freeze-frame",
         action="store_true",
         help="Best-effort freeze-frame / snapshot context (in-process mode only).",
     )
-    _add_can_args(dtc_read_p)
-    _add_connect_arg(dtc_read_p)
-    _add_can_id_mode_arg(dtc_read_p)
 
-    dtc_clear_p = dtc_sub.add_parser("clear", help="Clear DTCs")
-    _add_logging_args(dtc_clear_p)
+    dtc_clear_p = dtc_sub.add_parser("clear", help="Clear DTCs", parents=_ecu_parents())
     dtc_clear_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 01)")
-    _add_can_args(dtc_clear_p)
-    _add_connect_arg(dtc_clear_p)
-    _add_can_id_mode_arg(dtc_clear_p)
-
-    tui_p = sub.add_parser("tui", help="Run Textual TUI")
-    _add_logging_args(tui_p)
-    tui_p.add_argument("--can", default=None, help="SocketCAN interface (in-process mode)")
-    _add_connect_arg(tui_p)
-    _add_can_id_mode_arg(tui_p)
-    tui_p.add_argument("--addressing", choices=["functional", "physical", "both"], default="both")
-
-    daemon_p = sub.add_parser("daemon", help="Run Unix socket JSONL daemon")
-    _add_logging_args(daemon_p)
-    daemon_p.add_argument("--can", default="vcan0", help="SocketCAN interface (e.g. can0, vcan0)")
-    daemon_p.add_argument("--can-id-mode", choices=["11bit", "29bit"], default="11bit")
-    daemon_p.add_argument("--sock", default="/tmp/autosvc.sock", help="Unix socket path")
-    daemon_p.add_argument("--brand", default=None, help="Optional brand registry (e.g. vag)")
-
-    topo_p = sub.add_parser("topo", help="Topology operations")
-    _add_logging_args(topo_p)
-    topo_sub = topo_p.add_subparsers(dest="topo_cmd", required=True)
-    topo_scan_p = topo_sub.add_parser("scan", help="Scan and report topology")
-    _add_logging_args(topo_scan_p)
-    _add_can_args(topo_scan_p)
-    _add_connect_arg(topo_scan_p)
-    _add_discovery_args(topo_scan_p)
-
-    did_p = sub.add_parser("did", help="DID operations (ReadDataByIdentifier)")
-    _add_logging_args(did_p)
-    did_sub = did_p.add_subparsers(dest="did_cmd", required=True)
-    did_read_p = did_sub.add_parser("read", help="Read a DID")
-    _add_logging_args(did_read_p)
+
+
+def _build_tui_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--can", default=None, help="SocketCAN interface (in-process mode)")
+    parser.add_argument("--addressing", choices=_ADDRESSING_CHOICES, default="both")
+
+
+def _build_daemon_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--can", default="vcan0", help="SocketCAN interface (e.g. can0, vcan0)")
+    parser.add_argument("--can-id-mode", choices=_CAN_ID_MODE_CHOICES, default="11bit")
+    parser.add_argument("--sock", default="/tmp/autosvc.sock", help="Unix socket path")
+    parser.add_argument("--brand", default=None, help="Optional brand registry (e.g. vag)")
+
+
+def _build_topo_parser(parser: argparse.ArgumentParser) -> None:
+    topo_sub = parser.add_subparsers(dest="topo_cmd", required=True)
+    topo_sub.add_parser(
+        "scan",
+        help="Scan and report topology",
+        parents=_parents(_add_logging_args, _add_can_args, _add_connect_arg, _add_discovery_args),
+    )
+
+
+def _build_did_parser(parser: argparse.ArgumentParser) -> None:
+    did_sub = parser.add_subparsers(dest="did_cmd", required=True)
+    did_read_p = did_sub.add_parser("read", help="Read a DID", parents=_ecu_parents())
     did_read_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 01)")
     did_read_p.add_argument("--did", required=True, help="DID as hex (e.g. F190, 1234)")
-    _add_can_args(did_read_p)
-    _add_connect_arg(did_read_p)
-    _add_can_id_mode_arg(did_read_p)
 
-    security_p = sub.add_parser("security", help="UDS SecurityAccess (0x27)")
-    _add_logging_args(security_p)
-    security_sub = security_p.add_subparsers(dest="security_cmd", required=True)
 
-    sec_seed_p = security_sub.add_parser("seed", help="Request a SecurityAccess seed (0x27 requestSeed)")
-    _add_logging_args(sec_seed_p)
+def _build_security_parser(parser: argparse.ArgumentParser) -> None:
+    security_sub = parser.add_subparsers(dest="security_cmd", required=True)
+
+    sec_seed_p = security_sub.add_parser(
+        "seed",
+        help="Request a SecurityAccess seed (0x27 requestSeed)",
+        parents=_ecu_parents(),
+    )
     sec_seed_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     sec_seed_p.add_argument(
         "--level",
@@ -137,12 +241,12 @@ def main(argv: list[str] | None = None) -> None:
         help="Seed request level/sub-function as hex (typically odd, e.g. 01 or 0x01)",
     )
     sec_seed_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(sec_seed_p)
-    _add_connect_arg(sec_seed_p)
-    _add_can_id_mode_arg(sec_seed_p)
 
-    sec_unlock_p = security_sub.add_parser("unlock", help="Unlock SecurityAccess by sending a key (0x27 sendKey)")
-    _add_logging_args(sec_unlock_p)
+    sec_unlock_p = security_sub.add_parser(
+        "unlock",
+        help="Unlock SecurityAccess by sending a key (0x27 sendKey)",
+        parents=_ecu_parents(),
+    )
     sec_unlock_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     sec_unlock_p.add_argument(
         "--level",
@@ -170,80 +274,75 @@ def main(argv: list[str] | None = None) -> None:
         help="Optional user-provided Python module name or path to .py implementing compute_key(seed, level, ecu).",
     )
     sec_unlock_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(sec_unlock_p)
-    _add_connect_arg(sec_unlock_p)
-    _add_can_id_mode_arg(sec_unlock_p)
-
-    watch_p = sub.add_parser("watch", help="Watch live DIDs and stream events (JSONL)")
-    _add_logging_args(watch_p)
-    watch_p.add_argument("--items", required=True, help="Comma-separated list like 01:F190,01:1234")
-    watch_p.add_argument("--emit", choices=["changed", "always"], default="changed")
-    watch_p.add_argument("--ticks", type=int, default=10)
-    watch_p.add_argument("--tick-ms", type=int, default=200)
-    _add_can_args(watch_p)
-    _add_connect_arg(watch_p)
-    _add_can_id_mode_arg(watch_p)
-
-    backup_p = sub.add_parser("backup", help="Manual backups (DID snapshots)")
-    _add_logging_args(backup_p)
-    backup_sub = backup_p.add_subparsers(dest="backup_cmd", required=True)
-
-    backup_did_p = backup_sub.add_parser("did", help="Backup a DID value (snapshot)")
-    _add_logging_args(backup_did_p)
+
+
+def _build_watch_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--items", required=True, help="Comma-separated list like 01:F190,01:1234")
+    parser.add_argument("--emit", choices=_EMIT_CHOICES, default="changed")
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument("--tick-ms", type=int, default=200)
+
+
+def _build_backup_parser(parser: argparse.ArgumentParser) -> None:
+    backup_sub = parser.add_subparsers(dest="backup_cmd", required=True)
+
+    backup_did_p = backup_sub.add_parser("did", help="Backup a DID value (snapshot)", parents=_ecu_parents())
     backup_did_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     backup_did_p.add_argument("--did", required=True, help="DID as hex (e.g. F190, 1234)")
     backup_did_p.add_argument("--notes", default=None, help="Optional notes")
     backup_did_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(backup_did_p)
-    _add_connect_arg(backup_did_p)
-    _add_can_id_mode_arg(backup_did_p)
 
-    unsafe_p = sub.add_parser("unsafe", help="Unsafe mode password management")
-    _add_logging_args(unsafe_p)
-    unsafe_sub = unsafe_p.add_subparsers(dest="unsafe_cmd", required=True)
-    unsafe_set_p = unsafe_sub.add_parser("set-password", help="Set/replace the unsafe mode password")
-    _add_logging_args(unsafe_set_p)
 
-    unsafe_status_p = unsafe_sub.add_parser("status", help="Show whether the unsafe password is configured")
-    _add_logging_args(unsafe_status_p)
+def _build_unsafe_parser(parser: argparse.ArgumentParser) -> None:
+    unsafe_sub = parser.add_subparsers(dest="unsafe_cmd", required=True)
+    unsafe_sub.add_parser(
+        "set-password",
+        help="Set/replace the unsafe mode password",
+        parents=_parents(_add_logging_args),
+    )
+
+    unsafe_sub.add_parser(
+        "status",
+        help="Show whether the unsafe password is configured",
+        parents=_parents(_add_logging_args),
+    )
+
 
-    adapt_p = sub.add_parser("adapt", help="Adaptations (dataset-driven, with backup/revert safety)")
-    _add_logging_args(adapt_p)
-    adapt_sub = adapt_p.add_subparsers(dest="adapt_cmd", required=True)
+def _build_adapt_parser(parser: argparse.ArgumentParser) -> None:
+    adapt_sub = parser.add_subparsers(dest="adapt_cmd", required=True)
 
-    adapt_backup_p = adapt_sub.add_parser("backup", help="Create a manual backup snapshot for an adaptation key")
-    _add_logging_args(adapt_backup_p)
+    adapt_backup_p = adapt_sub.add_parser(
+        "backup",
+        help="Create a manual backup snapshot for an adaptation key",
+        parents=_ecu_parents(),
+    )
     adapt_backup_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     adapt_backup_p.add_argument("--key", required=True, help="Dataset setting key")
     adapt_backup_p.add_argument("--notes", default=None, help="Optional notes")
     adapt_backup_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(adapt_backup_p)
-    _add_connect_arg(adapt_backup_p)
-    _add_can_id_mode_arg(adapt_backup_p)
 
-    adapt_list_p = adapt_sub.add_parser("list", help="List available adaptation settings for an ECU")
-    _add_logging_args(adapt_list_p)
+    adapt_list_p = adapt_sub.add_parser(
+        "list",
+        help="List available adaptation settings for an ECU",
+        parents=_ecu_parents(),
+    )
     adapt_list_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     adapt_list_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(adapt_list_p)
-    _add_connect_arg(adapt_list_p)
-    _add_can_id_mode_arg(adapt_list_p)
 
-    adapt_read_p = adapt_sub.add_parser("read", help="Read an adaptation setting")
-    _add_logging_args(adapt_read_p)
+    adapt_read_p = adapt_sub.add_parser("read", help="Read an adaptation setting", parents=_ecu_parents())
     adapt_read_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     adapt_read_p.add_argument("--key", required=True, help="Dataset setting key")
     adapt_read_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(adapt_read_p)
-    _add_connect_arg(adapt_read_p)
-    _add_can_id_mode_arg(adapt_read_p)
 
-    adapt_write_p = adapt_sub.add_parser("write", help="Write an adaptation setting (with backup)")
-    _add_logging_args(adapt_write_p)
+    adapt_write_p = adapt_sub.add_parser(
+        "write",
+        help="Write an adaptation setting (with backup)",
+        parents=_ecu_parents(),
+    )
     adapt_write_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     adapt_write_p.add_argument("--key", required=True, help="Dataset setting key")
     adapt_write_p.add_argument("--value", required=True, help="New value (format depends on kind)")
-    adapt_write_p.add_argument("--mode", choices=["safe", "advanced", "unsafe"], default="safe")
+    adapt_write_p.add_argument("--mode", choices=_WRITE_MODE_CHOICES, default="safe")
     adapt_write_p.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
     adapt_write_p.add_argument(
         "--unsafe-password-stdin",
@@ -276,16 +375,12 @@ def main(argv: list[str] | None = None) -> None:
         help="Optional user-provided Python module name or .py path implementing compute_key(seed, level, ecu).",
     )
     adapt_write_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(adapt_write_p)
-    _add_connect_arg(adapt_write_p)
-    _add_can_id_mode_arg(adapt_write_p)
 
-    adapt_raw_p = adapt_sub.add_parser("write-raw", help="Unsafe raw DID write (with backup)")
-    _add_logging_args(adapt_raw_p)
+    adapt_raw_p = adapt_sub.add_parser("write-raw", help="Unsafe raw DID write (with backup)", parents=_ecu_parents())
     adapt_raw_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     adapt_raw_p.add_argument("--did", required=True, help="DID as hex (e.g. 1234)")
     adapt_raw_p.add_argument("--hex", dest="hex_payload", required=True, help="Raw bytes as hex (e.g. 01)")
-    adapt_raw_p.add_argument("--mode", choices=["unsafe"], default="unsafe")
+    adapt_raw_p.add_argument("--mode", choices=_RAW_WRITE_MODE_CHOICES, default="unsafe")
     adapt_raw_p.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
     adapt_raw_p.add_argument(
         "--unsafe-password-stdin",
@@ -318,56 +413,52 @@ def main(argv: list[str] | None = None) -> None:
         help="Optional user-provided Python module name or .py path implementing compute_key(seed, level, ecu).",
     )
     adapt_raw_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(adapt_raw_p)
-    _add_connect_arg(adapt_raw_p)
-    _add_can_id_mode_arg(adapt_raw_p)
 
-    adapt_rev_p = adapt_sub.add_parser("revert", help="Revert a previous write using a backup id")
-    _add_logging_args(adapt_rev_p)
+    adapt_rev_p = adapt_sub.add_parser(
+        "revert",
+        help="Revert a previous write using a backup id",
+        parents=_ecu_parents(),
+    )
     adapt_rev_p.add_argument("--backup-id", required=True, help="Backup id (e.g. 000001)")
     adapt_rev_p.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
     adapt_rev_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(adapt_rev_p)
-    _add_connect_arg(adapt_rev_p)
-    _add_can_id_mode_arg(adapt_rev_p)
 
-    coding_p = sub.add_parser("coding", help="Long coding (dataset-driven bitfields, with backup/revert safety)")
-    _add_logging_args(coding_p)
-    coding_sub = coding_p.add_subparsers(dest="coding_cmd", required=True)
 
-    coding_list_p = coding_sub.add_parser("list", help="List available long coding fields for an ECU")
-    _add_logging_args(coding_list_p)
+def _build_coding_parser(parser: argparse.ArgumentParser) -> None:
+    coding_sub = parser.add_subparsers(dest="coding_cmd", required=True)
+
+    coding_list_p = coding_sub.add_parser(
+        "list",
+        help="List available long coding fields for an ECU",
+        parents=_ecu_parents(),
+    )
     coding_list_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     coding_list_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(coding_list_p)
-    _add_connect_arg(coding_list_p)
-    _add_can_id_mode_arg(coding_list_p)
 
-    coding_read_p = coding_sub.add_parser("read", help="Read a long coding field")
-    _add_logging_args(coding_read_p)
+    coding_read_p = coding_sub.add_parser("read", help="Read a long coding field", parents=_ecu_parents())
     coding_read_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     coding_read_p.add_argument("--key", required=True, help="Dataset field key")
     coding_read_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(coding_read_p)
-    _add_connect_arg(coding_read_p)
-    _add_can_id_mode_arg(coding_read_p)
 
-    coding_backup_p = coding_sub.add_parser("backup", help="Create a manual backup snapshot for a long coding key")
-    _add_logging_args(coding_backup_p)
+    coding_backup_p = coding_sub.add_parser(
+        "backup",
+        help="Create a manual backup snapshot for a long coding key",
+        parents=_ecu_parents(),
+    )
     coding_backup_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     coding_backup_p.add_argument("--key", required=True, help="Dataset field key")
     coding_backup_p.add_argument("--notes", default=None, help="Optional notes")
     coding_backup_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(coding_backup_p)
-    _add_connect_arg(coding_backup_p)
-    _add_can_id_mode_arg(coding_backup_p)
 
-    coding_write_p = coding_sub.add_parser("write", help="Write a long coding field (with backup)")
-    _add_logging_args(coding_write_p)
+    coding_write_p = coding_sub.add_parser(
+        "write",
+        help="Write a long coding field (with backup)",
+        parents=_ecu_parents(),
+    )
     coding_write_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     coding_write_p.add_argument("--key", required=True, help="Dataset field key")
     coding_write_p.add_argument("--value", required=True, help="New value")
-    coding_write_p.add_argument("--mode", choices=["safe", "advanced", "unsafe"], default="safe")
+    coding_write_p.add_argument("--mode", choices=_WRITE_MODE_CHOICES, default="safe")
     coding_write_p.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
     coding_write_p.add_argument(
         "--unsafe-password-stdin",
@@ -400,16 +491,12 @@ def main(argv: list[str] | None = None) -> None:
         help="Optional user-provided Python module name or .py path implementing compute_key(seed, level, ecu).",
     )
     coding_write_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(coding_write_p)
-    _add_connect_arg(coding_write_p)
-    _add_can_id_mode_arg(coding_write_p)
 
-    coding_raw_p = coding_sub.add_parser("write-raw", help="Unsafe raw DID write (with backup)")
-    _add_logging_args(coding_raw_p)
+    coding_raw_p = coding_sub.add_parser("write-raw", help="Unsafe raw DID write (with backup)", parents=_ecu_parents())
     coding_raw_p.add_argument("--ecu", required=True, help="ECU address as hex (e.g. 09)")
     coding_raw_p.add_argument("--did", required=True, help="DID as hex (e.g. 0600)")
     coding_raw_p.add_argument("--hex", dest="hex_payload", required=True, help="Raw bytes as hex (e.g. 01020304)")
-    coding_raw_p.add_argument("--mode", choices=["unsafe"], default="unsafe")
+    coding_raw_p.add_argument("--mode", choices=_RAW_WRITE_MODE_CHOICES, default="unsafe")
     coding_raw_p.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
     coding_raw_p.add_argument(
         "--unsafe-password-stdin",
@@ -442,545 +529,533 @@ def main(argv: list[str] | None = None) -> None:
         help="Optional user-provided Python module name or .py path implementing compute_key(seed, level, ecu).",
     )
     coding_raw_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(coding_raw_p)
-    _add_connect_arg(coding_raw_p)
-    _add_can_id_mode_arg(coding_raw_p)
 
-    coding_rev_p = coding_sub.add_parser("revert", help="Revert a previous long coding write using a backup id")
-    _add_logging_args(coding_rev_p)
+    coding_rev_p = coding_sub.add_parser(
+        "revert",
+        help="Revert a previous long coding write using a backup id",
+        parents=_ecu_parents(),
+    )
     coding_rev_p.add_argument("--backup-id", required=True, help="Backup id (e.g. 000001)")
     coding_rev_p.add_argument("--yes", action="store_true", help="Skip confirmation prompts")
     coding_rev_p.add_argument("--json", action="store_true", help="Output deterministic JSON (for tests)")
-    _add_can_args(coding_rev_p)
-    _add_connect_arg(coding_rev_p)
-    _add_can_id_mode_arg(coding_rev_p)
 
-    args = parser.parse_args(argv)
 
-    _apply_dir_overrides(args)
+def _dispatch(args: argparse.Namespace) -> int:
+    handler = _DISPATCH.get((args.cmd, vars(args).get(f"{args.cmd}_cmd")))
+    if handler is None:
+        raise SystemExit("error: unknown command")
+    return handler(args)
 
-    # Ensure base dirs exist early (for unsafe password and backup store).
-    ensure_dirs(load_dirs())
 
-    # Logging (stderr/file). Keep command results on stdout.
-    level_name: str | None = getattr(args, "log_level", None)
-    if getattr(args, "trace", False):
-        level = TRACE_LEVEL
-    elif getattr(args, "verbose", False):
-        level = logging.DEBUG
+def _connect_of(args: argparse.Namespace) -> str | None:
+    return vars(args).get("connect") or args.global_connect
+
+
+def _reject_daemon_mode(args: argparse.Namespace, error: str) -> None:
+    if _connect_of(args):
+        _print_json({"ok": False, "error": error})
+        raise SystemExit(1)
+
+
+def _do_daemon(args: argparse.Namespace) -> int:
+    from autosvc.apps.daemon import serve
+
+    # Logging and the --log-dir bundle are already set up by main(); no argv round-trip.
+    serve(can=args.can, can_id_mode=args.can_id_mode, sock=args.sock, brand=args.brand)
+    return 0
+
+
+def _do_tui(args: argparse.Namespace) -> int:
+    from autosvc.apps.tui import run
+
+    run(connect=_connect_of(args), can=args.can, can_id_mode=args.can_id_mode, addressing=args.addressing)
+    return 0
+
+
+def _do_unsafe_set_password(args: argparse.Namespace) -> int:
+    from autosvc.unsafe import set_password_interactive
+
+    set_password_interactive(dirs=_dirs())
+    _print_json({"ok": True})
+    return 0
+
+
+def _do_unsafe_status(args: argparse.Namespace) -> int:
+    from autosvc.unsafe import is_password_configured
+
+    _print_json({"ok": True, "configured": bool(is_password_configured(dirs=_dirs()))})
+    return 0
+
+
+def _do_backup_did(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "backup is not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="backup_did",
+        ecu=args.ecu,
+        did=args.did,
+        notes=args.notes,
+        log_dir=getattr(args, "log_dir", None),
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
+
+
+def _ipc_or_inprocess(args: argparse.Namespace, ipc_payload: dict[str, Any], op: str, **kwargs: Any) -> int:
+    # Shared tail of commands that run either through the daemon (--connect) or in-process.
+    connect = _connect_of(args)
+    if connect:
+        response = _ipc_request(connect, ipc_payload)
     else:
-        level = parse_log_level(level_name)
+        response = _run_inprocess(args.can, can_id_mode=args.can_id_mode, op=op, **kwargs)
+    _print_json(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_scan(args: argparse.Namespace) -> int:
+    return _ipc_or_inprocess(
+        args,
+        {"cmd": "scan_ecus"},
+        "scan",
+        addressing=args.addressing,
+        timeout_ms=args.timeout_ms,
+        retries=args.retries,
+        probe_session=args.probe_session,
+    )
 
-    trace_id = uuid.uuid4().hex[:12]
 
-    log_file = getattr(args, "log_file", None)
-    runlog = None
-    result_fh = None
-    stdout_orig = sys.stdout
-    try:
-        if getattr(args, "log_dir", None):
-            argv_for_meta = [parser.prog] + (list(argv) if argv is not None else sys.argv[1:])
-            argv_for_meta = _redact_sensitive_argv(argv_for_meta)
-            runlog = create_run_log_dir(str(args.log_dir), trace_id=trace_id, argv=argv_for_meta)
-            if not log_file:
-                log_file = str(runlog.log_path)
-            result_fh = open(runlog.result_path, "w", encoding="utf-8")
-            sys.stdout = TeeTextIO(sys.stdout, result_fh)
+def _do_topo_scan(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "topology scan is not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="scan_topology",
+        addressing=args.addressing,
+        timeout_ms=args.timeout_ms,
+        retries=args.retries,
+        probe_session=args.probe_session,
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_dtc_read(args: argparse.Namespace) -> int:
+    if args.with_freeze_frame and _connect_of(args):
+        _print_json({"ok": False, "error": "freeze-frame is not available in daemon mode"})
+        return 1
+    return _ipc_or_inprocess(
+        args,
+        {"cmd": "read_dtcs", "ecu": args.ecu},
+        "read_dtcs",
+        ecu=args.ecu,
+        with_freeze_frame=bool(args.with_freeze_frame),
+    )
 
-        setup_logging(
-            level=level,
-            log_format=str(getattr(args, "log_format", "pretty") or "pretty"),
-            log_file=log_file,
-            no_color=bool(getattr(args, "no_color", False)),
-        )
 
-        with trace_context(trace_id):
-            log.debug("CLI start", extra={"cmd": getattr(args, "cmd", None), "trace_id": trace_id})
-            _dispatch(args)
-    finally:
-        sys.stdout = stdout_orig
-        if result_fh is not None:
-            result_fh.flush()
-            result_fh.close()
+def _do_dtc_clear(args: argparse.Namespace) -> int:
+    return _ipc_or_inprocess(args, {"cmd": "clear_dtcs", "ecu": args.ecu}, "clear_dtcs", ecu=args.ecu)
 
 
-def _dispatch(args: argparse.Namespace) -> None:
-    if args.cmd == "daemon":
-        from autosvc.apps.daemon import main as daemon_main
-
-        daemon_argv = ["--can", args.can, "--can-id-mode", args.can_id_mode, "--sock", args.sock]
-        if getattr(args, "brand", None):
-            daemon_argv.extend(["--brand", args.brand])
-        # Forward logging flags when daemon is invoked via the umbrella CLI.
-        daemon_argv.extend(_logging_argv_from_args(args))
-        daemon_main(daemon_argv)
-        return None
-
-    if args.cmd == "tui":
-        from autosvc.apps.tui import main as tui_main
-
-        connect = getattr(args, "connect", None) or args.global_connect
-        tui_args: list[str] = []
-        if connect:
-            tui_args.extend(["--connect", connect])
-        if getattr(args, "can", None):
-            tui_args.extend(["--can", args.can])
-        if getattr(args, "can_id_mode", None):
-            tui_args.extend(["--can-id-mode", args.can_id_mode])
-        if getattr(args, "addressing", None):
-            tui_args.extend(["--addressing", args.addressing])
-        tui_args.extend(_logging_argv_from_args(args))
-        tui_main(tui_args)
-        return None
-
-    if args.cmd == "unsafe" and args.unsafe_cmd == "set-password":
-        from autosvc.unsafe import set_password_interactive
-
-        set_password_interactive()
-        _print_json({"ok": True})
-        raise SystemExit(0)
-
-    if args.cmd == "unsafe" and args.unsafe_cmd == "status":
-        from autosvc.unsafe import is_password_configured
-
-        _print_json({"ok": True, "configured": bool(is_password_configured())})
-        raise SystemExit(0)
-
-    if args.cmd == "backup" and args.backup_cmd == "did":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            _print_json({"ok": False, "error": "backup is not available in daemon mode"})
-            raise SystemExit(1)
-        response = _run_inprocess(
-            args.can,
-            can_id_mode=args.can_id_mode,
-            op="backup_did",
-            ecu=args.ecu,
-            did=args.did,
-            notes=args.notes,
-            log_dir=getattr(args, "log_dir", None),
-        )
-        _print_json(response)
-        raise SystemExit(0 if response.get("ok") else 1)
-
-    if args.cmd == "scan":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            response = _ipc_request(connect, {"cmd": "scan_ecus"})
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        response = _run_inprocess(
-            args.can,
-            can_id_mode=args.can_id_mode,
-            op="scan",
-            addressing=args.addressing,
-            timeout_ms=args.timeout_ms,
-            retries=args.retries,
-            probe_session=args.probe_session,
-        )
-        _print_json(response)
-        raise SystemExit(0 if response.get("ok") else 1)
-
-    if args.cmd == "topo" and args.topo_cmd == "scan":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            _print_json({"ok": False, "error": "topology scan is not available in daemon mode"})
-            raise SystemExit(1)
-        response = _run_inprocess(
-            args.can,
-            can_id_mode=args.can_id_mode,
-            op="scan_topology",
-            addressing=args.addressing,
-            timeout_ms=args.timeout_ms,
-            retries=args.retries,
-            probe_session=args.probe_session,
-        )
-        _print_json(response)
-        raise SystemExit(0 if response.get("ok") else 1)
+def _do_did_read(args: argparse.Namespace) -> int:
+    return _ipc_or_inprocess(
+        args,
+        {"cmd": "read_did", "ecu": args.ecu, "did": args.did},
+        "read_did",
+        ecu=args.ecu,
+        did=args.did,
+    )
 
-    if args.cmd == "dtc" and args.dtc_cmd == "read":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            if args.with_freeze_frame:
-                _print_json({"ok": False, "error": "freeze-frame is not available in daemon mode"})
-                raise SystemExit(1)
-            response = _ipc_request(connect, {"cmd": "read_dtcs", "ecu": args.ecu})
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        response = _run_inprocess(
-            args.can,
-            can_id_mode=args.can_id_mode,
-            op="read_dtcs",
-            ecu=args.ecu,
-            with_freeze_frame=bool(args.with_freeze_frame),
-        )
-        _print_json(response)
-        raise SystemExit(0 if response.get("ok") else 1)
 
-    if args.cmd == "dtc" and args.dtc_cmd == "clear":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            response = _ipc_request(connect, {"cmd": "clear_dtcs", "ecu": args.ecu})
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
+def _do_security_seed(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "security access is not available in daemon mode")
+    level_int = _parse_hex_int(getattr(args, "level", ""), bits=8, name="level")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="security_seed",
+        ecu=args.ecu,
+        security_level=level_int,
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_security_unlock(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "security access is not available in daemon mode")
+    level_int = _parse_hex_int(getattr(args, "level", ""), bits=8, name="level")
+    key_hex = _read_key_hex_from_args(args)
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="security_unlock",
+        ecu=args.ecu,
+        security_level=level_int,
+        security_key_hex=key_hex,
+        security_algo_module=getattr(args, "algo_module", None),
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
 
-        response = _run_inprocess(args.can, can_id_mode=args.can_id_mode, op="clear_dtcs", ecu=args.ecu)
-        _print_json(response)
-        raise SystemExit(0 if response.get("ok") else 1)
-
-    if args.cmd == "did" and args.did_cmd == "read":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            response = _ipc_request(connect, {"cmd": "read_did", "ecu": args.ecu, "did": args.did})
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        response = _run_inprocess(
-            args.can,
-            can_id_mode=args.can_id_mode,
-            op="read_did",
-            ecu=args.ecu,
-            did=args.did,
-        )
-        _print_json(response)
-        raise SystemExit(0 if response.get("ok") else 1)
-
-    if args.cmd == "security":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            _print_json({"ok": False, "error": "security access is not available in daemon mode"})
-            raise SystemExit(1)
-
-        level_int = _parse_hex_int(getattr(args, "level", ""), bits=8, name="level")
-
-        if args.security_cmd == "seed":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="security_seed",
-                ecu=args.ecu,
-                security_level=level_int,
-            )
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.security_cmd == "unlock":
-            key_hex = _read_key_hex_from_args(args)
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="security_unlock",
-                ecu=args.ecu,
-                security_level=level_int,
-                security_key_hex=key_hex,
-                security_algo_module=getattr(args, "algo_module", None),
-            )
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-    if args.cmd == "watch":
-        connect = getattr(args, "connect", None) or args.global_connect
-        items = _parse_watch_items(args.items)
-        if connect:
-            _watch_via_daemon(
-                connect,
-                items=items,
-                emit=args.emit,
-                tick_ms=args.tick_ms,
-                ticks=args.ticks,
-            )
-            raise SystemExit(0)
 
-        _watch_inprocess(
-            args.can,
-            can_id_mode=args.can_id_mode,
+def _do_watch(args: argparse.Namespace) -> int:
+    connect = _connect_of(args)
+    items = _parse_watch_items(args.items)
+    if connect:
+        _watch_via_daemon(
+            connect,
             items=items,
             emit=args.emit,
             tick_ms=args.tick_ms,
             ticks=args.ticks,
         )
-        raise SystemExit(0)
-
-    if args.cmd == "adapt":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            _print_json({"ok": False, "error": "adaptations are not available in daemon mode"})
-            raise SystemExit(1)
-
-        if args.adapt_cmd == "list":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="adapt_list",
-                ecu=args.ecu,
-            )
-            if args.json:
-                _print_json(response)
-            else:
-                _print_adapt_list(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.adapt_cmd == "read":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="adapt_read",
-                ecu=args.ecu,
-                key=args.key,
-            )
-            if args.json:
-                _print_json(response)
-            else:
-                _print_adapt_read(response)
-            raise SystemExit(0 if response.get("ok") else 1)
+        return 0
+
+    _watch_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        items=items,
+        emit=args.emit,
+        tick_ms=args.tick_ms,
+        ticks=args.ticks,
+    )
+    return 0
 
-        if args.adapt_cmd == "write":
-            if args.mode == "safe":
-                _print_json({"ok": False, "error": "safe mode is read-only (use --mode advanced or --mode unsafe)"})
-                raise SystemExit(1)
 
-            unsafe_password = None
-            if args.mode == "unsafe":
-                unsafe_password = _get_unsafe_password(args)
+def _do_adapt_list(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "adaptations are not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="adapt_list",
+        ecu=args.ecu,
+    )
+    if args.json:
+        _print_json(response)
+    else:
+        _print_adapt_list(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_adapt_read(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "adaptations are not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="adapt_read",
+        ecu=args.ecu,
+        key=args.key,
+    )
+    if args.json:
+        _print_json(response)
+    else:
+        _print_adapt_read(response)
+    return 0 if response.get("ok") else 1
 
-            # advanced/unsafe require explicit confirmation token
-            confirm_or_raise(
-                f"About to write adaptation ECU={args.ecu} key={args.key} value={args.value} mode={args.mode}.",
-                assume_yes=bool(args.yes),
-                token="APPLY",
-            )
 
-            sec_level_int = None
-            if getattr(args, "security_level", None):
-                sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
-            sec_key_hex = _read_security_key_hex_from_args(args)
-
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="adapt_write",
-                ecu=args.ecu,
-                key=args.key,
-                value=args.value,
-                mode=args.mode,
-                unsafe_password=unsafe_password,
-                log_dir=getattr(args, "log_dir", None),
-                security_level=sec_level_int,
-                security_key_hex=sec_key_hex,
-                security_algo_module=getattr(args, "security_algo_module", None),
-            )
-            if args.json:
-                _print_json(response)
-            else:
-                _print_adapt_write(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.adapt_cmd == "write-raw":
-            unsafe_password = _get_unsafe_password(args)
-            confirm_or_raise(
-                f"About to perform raw DID write ECU={args.ecu} DID={args.did} HEX={args.hex_payload}.",
-                assume_yes=bool(args.yes),
-                token="APPLY",
-            )
-            sec_level_int = None
-            if getattr(args, "security_level", None):
-                sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
-            sec_key_hex = _read_security_key_hex_from_args(args)
-
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="adapt_write_raw",
-                ecu=args.ecu,
-                did=args.did,
-                hex_payload=args.hex_payload,
-                mode=args.mode,
-                unsafe_password=unsafe_password,
-                log_dir=getattr(args, "log_dir", None),
-                security_level=sec_level_int,
-                security_key_hex=sec_key_hex,
-                security_algo_module=getattr(args, "security_algo_module", None),
-            )
-            if args.json:
-                _print_json(response)
-            else:
-                _print_adapt_write(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.adapt_cmd == "revert":
-            confirm_or_raise(
-                f"About to revert adaptation backup_id={args.backup_id}.",
-                assume_yes=bool(args.yes),
-                token="APPLY",
-            )
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="adapt_revert",
-                backup_id=args.backup_id,
-            )
-            if args.json:
-                _print_json(response)
-            else:
-                _print_adapt_write(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.adapt_cmd == "backup":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="adapt_backup",
-                ecu=args.ecu,
-                key=args.key,
-                notes=args.notes,
-                log_dir=getattr(args, "log_dir", None),
-            )
-            _print_json(response) if args.json else _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
+def _do_adapt_write(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "adaptations are not available in daemon mode")
+    from autosvc.core.safety.confirm import confirm_or_raise
 
-        raise SystemExit("error: unknown adapt command")
+    if args.mode == "safe":
+        _print_json({"ok": False, "error": "safe mode is read-only (use --mode advanced or --mode unsafe)"})
+        return 1
 
+    unsafe_password = None
+    if args.mode == "unsafe":
+        unsafe_password = _get_unsafe_password(args)
 
-    if args.cmd == "coding":
-        connect = getattr(args, "connect", None) or args.global_connect
-        if connect:
-            _print_json({"ok": False, "error": "long coding is not available in daemon mode"})
-            raise SystemExit(1)
+    # advanced/unsafe require explicit confirmation token
+    confirm_or_raise(
+        f"About to write adaptation ECU={args.ecu} key={args.key} value={args.value} mode={args.mode}.",
+        assume_yes=bool(args.yes),
+        token="APPLY",
+    )
 
-        if args.coding_cmd == "list":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="coding_list",
-                ecu=args.ecu,
-            )
-            if args.json:
-                _print_json(response)
-            else:
-                _print_coding_list(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.coding_cmd == "read":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="coding_read",
-                ecu=args.ecu,
-                key=args.key,
-            )
-            _print_json(response) if args.json else _print_coding_read(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.coding_cmd == "backup":
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="coding_backup",
-                ecu=args.ecu,
-                key=args.key,
-                notes=args.notes,
-                log_dir=getattr(args, "log_dir", None),
-            )
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
+    sec_level_int = None
+    if getattr(args, "security_level", None):
+        sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
+    sec_key_hex = _read_security_key_hex_from_args(args)
+
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="adapt_write",
+        ecu=args.ecu,
+        key=args.key,
+        value=args.value,
+        mode=args.mode,
+        unsafe_password=unsafe_password,
+        log_dir=getattr(args, "log_dir", None),
+        security_level=sec_level_int,
+        security_key_hex=sec_key_hex,
+        security_algo_module=getattr(args, "security_algo_module", None),
+    )
+    if args.json:
+        _print_json(response)
+    else:
+        _print_adapt_write(response)
+    return 0 if response.get("ok") else 1
 
-        if args.coding_cmd == "write":
-            if args.mode == "safe":
-                _print_json({"ok": False, "error": "safe mode is read-only (use --mode advanced or --mode unsafe)"})
-                raise SystemExit(1)
 
-            unsafe_password = None
-            if args.mode == "unsafe":
-                unsafe_password = _get_unsafe_password(args)
+def _do_adapt_write_raw(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "adaptations are not available in daemon mode")
+    from autosvc.core.safety.confirm import confirm_or_raise
 
-            confirm_or_raise(
-                f"About to write long coding ECU={args.ecu} key={args.key} value={args.value} mode={args.mode}.",
-                assume_yes=bool(args.yes),
-                token="APPLY",
-            )
-            sec_level_int = None
-            if getattr(args, "security_level", None):
-                sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
-            sec_key_hex = _read_security_key_hex_from_args(args)
-
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="coding_write",
-                ecu=args.ecu,
-                key=args.key,
-                value=args.value,
-                mode=args.mode,
-                unsafe_password=unsafe_password,
-                log_dir=getattr(args, "log_dir", None),
-                security_level=sec_level_int,
-                security_key_hex=sec_key_hex,
-                security_algo_module=getattr(args, "security_algo_module", None),
-            )
-            _print_json(response) if args.json else _print_coding_write(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.coding_cmd == "write-raw":
-            unsafe_password = _get_unsafe_password(args)
-            confirm_or_raise(
-                f"About to perform raw DID write ECU={args.ecu} DID={args.did} HEX={args.hex_payload}.",
-                assume_yes=bool(args.yes),
-                token="APPLY",
-            )
-            sec_level_int = None
-            if getattr(args, "security_level", None):
-                sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
-            sec_key_hex = _read_security_key_hex_from_args(args)
-
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="coding_write_raw",
-                ecu=args.ecu,
-                did=args.did,
-                hex_payload=args.hex_payload,
-                mode=args.mode,
-                unsafe_password=unsafe_password,
-                log_dir=getattr(args, "log_dir", None),
-                security_level=sec_level_int,
-                security_key_hex=sec_key_hex,
-                security_algo_module=getattr(args, "security_algo_module", None),
-            )
-            _print_json(response)
-            raise SystemExit(0 if response.get("ok") else 1)
-
-        if args.coding_cmd == "revert":
-            confirm_or_raise(
-                f"About to revert long coding backup_id={args.backup_id}.",
-                assume_yes=bool(args.yes),
-                token="APPLY",
-            )
-            response = _run_inprocess(
-                args.can,
-                can_id_mode=args.can_id_mode,
-                op="coding_revert",
-                backup_id=args.backup_id,
-            )
-            _print_json(response) if args.json else _print_coding_write(response)
-            raise SystemExit(0 if response.get("ok") else 1)
+    unsafe_password = _get_unsafe_password(args)
+    confirm_or_raise(
+        f"About to perform raw DID write ECU={args.ecu} DID={args.did} HEX={args.hex_payload}.",
+        assume_yes=bool(args.yes),
+        token="APPLY",
+    )
+    sec_level_int = None
+    if getattr(args, "security_level", None):
+        sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
+    sec_key_hex = _read_security_key_hex_from_args(args)
+
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="adapt_write_raw",
+        ecu=args.ecu,
+        did=args.did,
+        hex_payload=args.hex_payload,
+        mode=args.mode,
+        unsafe_password=unsafe_password,
+        log_dir=getattr(args, "log_dir", None),
+        security_level=sec_level_int,
+        security_key_hex=sec_key_hex,
+        security_algo_module=getattr(args, "security_algo_module", None),
+    )
+    if args.json:
+        _print_json(response)
+    else:
+        _print_adapt_write(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_adapt_revert(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "adaptations are not available in daemon mode")
+    from autosvc.core.safety.confirm import confirm_or_raise
+
+    confirm_or_raise(
+        f"About to revert adaptation backup_id={args.backup_id}.",
+        assume_yes=bool(args.yes),
+        token="APPLY",
+    )
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="adapt_revert",
+        backup_id=args.backup_id,
+    )
+    if args.json:
+        _print_json(response)
+    else:
+        _print_adapt_write(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_adapt_backup(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "adaptations are not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="adapt_backup",
+        ecu=args.ecu,
+        key=args.key,
+        notes=args.notes,
+        log_dir=getattr(args, "log_dir", None),
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_coding_list(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "long coding is not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="coding_list",
+        ecu=args.ecu,
+    )
+    if args.json:
+        _print_json(response)
+    else:
+        _print_coding_list(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_coding_read(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "long coding is not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="coding_read",
+        ecu=args.ecu,
+        key=args.key,
+    )
+    _print_json(response) if args.json else _print_coding_read(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_coding_backup(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "long coding is not available in daemon mode")
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="coding_backup",
+        ecu=args.ecu,
+        key=args.key,
+        notes=args.notes,
+        log_dir=getattr(args, "log_dir", None),
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
 
-        raise SystemExit("error: unknown coding command")
 
-    raise SystemExit("error: unknown command")
+def _do_coding_write(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "long coding is not available in daemon mode")
+    from autosvc.core.safety.confirm import confirm_or_raise
+
+    if args.mode == "safe":
+        _print_json({"ok": False, "error": "safe mode is read-only (use --mode advanced or --mode unsafe)"})
+        return 1
+
+    unsafe_password = None
+    if args.mode == "unsafe":
+        unsafe_password = _get_unsafe_password(args)
+
+    confirm_or_raise(
+        f"About to write long coding ECU={args.ecu} key={args.key} value={args.value} mode={args.mode}.",
+        assume_yes=bool(args.yes),
+        token="APPLY",
+    )
+    sec_level_int = None
+    if getattr(args, "security_level", None):
+        sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
+    sec_key_hex = _read_security_key_hex_from_args(args)
+
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="coding_write",
+        ecu=args.ecu,
+        key=args.key,
+        value=args.value,
+        mode=args.mode,
+        unsafe_password=unsafe_password,
+        log_dir=getattr(args, "log_dir", None),
+        security_level=sec_level_int,
+        security_key_hex=sec_key_hex,
+        security_algo_module=getattr(args, "security_algo_module", None),
+    )
+    _print_json(response) if args.json else _print_coding_write(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_coding_write_raw(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "long coding is not available in daemon mode")
+    from autosvc.core.safety.confirm import confirm_or_raise
+
+    unsafe_password = _get_unsafe_password(args)
+    confirm_or_raise(
+        f"About to perform raw DID write ECU={args.ecu} DID={args.did} HEX={args.hex_payload}.",
+        assume_yes=bool(args.yes),
+        token="APPLY",
+    )
+    sec_level_int = None
+    if getattr(args, "security_level", None):
+        sec_level_int = _parse_hex_int(str(args.security_level), bits=8, name="security-level")
+    sec_key_hex = _read_security_key_hex_from_args(args)
+
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="coding_write_raw",
+        ecu=args.ecu,
+        did=args.did,
+        hex_payload=args.hex_payload,
+        mode=args.mode,
+        unsafe_password=unsafe_password,
+        log_dir=getattr(args, "log_dir", None),
+        security_level=sec_level_int,
+        security_key_hex=sec_key_hex,
+        security_algo_module=getattr(args, "security_algo_module", None),
+    )
+    _print_json(response)
+    return 0 if response.get("ok") else 1
+
+
+def _do_coding_revert(args: argparse.Namespace) -> int:
+    _reject_daemon_mode(args, "long coding is not available in daemon mode")
+    from autosvc.core.safety.confirm import confirm_or_raise
+
+    confirm_or_raise(
+        f"About to revert long coding backup_id={args.backup_id}.",
+        assume_yes=bool(args.yes),
+        token="APPLY",
+    )
+    response = _run_inprocess(
+        args.can,
+        can_id_mode=args.can_id_mode,
+        op="coding_revert",
+        backup_id=args.backup_id,
+    )
+    _print_json(response) if args.json else _print_coding_write(response)
+    return 0 if response.get("ok") else 1
+
+
+# (cmd, subcommand) -> handler; subcommand is None for single-level commands.
+_DISPATCH: dict[tuple[str, str | None], Callable[[argparse.Namespace], int]] = {
+    ("daemon", None): _do_daemon,
+    ("tui", None): _do_tui,
+    ("scan", None): _do_scan,
+    ("watch", None): _do_watch,
+    ("unsafe", "set-password"): _do_unsafe_set_password,
+    ("unsafe", "status"): _do_unsafe_status,
+    ("backup", "did"): _do_backup_did,
+    ("topo", "scan"): _do_topo_scan,
+    ("dtc", "read"): _do_dtc_read,
+    ("dtc", "clear"): _do_dtc_clear,
+    ("did", "read"): _do_did_read,
+    ("security", "seed"): _do_security_seed,
+    ("security", "unlock"): _do_security_unlock,
+    ("adapt", "list"): _do_adapt_list,
+    ("adapt", "read"): _do_adapt_read,
+    ("adapt", "write"): _do_adapt_write,
+    ("adapt", "write-raw"): _do_adapt_write_raw,
+    ("adapt", "revert"): _do_adapt_revert,
+    ("adapt", "backup"): _do_adapt_backup,
+    ("coding", "list"): _do_coding_list,
+    ("coding", "read"): _do_coding_read,
+    ("coding", "backup"): _do_coding_backup,
+    ("coding", "write"): _do_coding_write,
+    ("coding", "write-raw"): _do_coding_write_raw,
+    ("coding", "revert"): _do_coding_revert,
+}
 
 
 def _apply_dir_overrides(args: argparse.Namespace) -> None:
     # Apply as env vars so core stays CLI-agnostic.
-    if getattr(args, "config_dir", None):
-        os.environ["AUTOSVC_CONFIG_DIR"] = str(args.config_dir)
-    if getattr(args, "cache_dir", None):
-        os.environ["AUTOSVC_CACHE_DIR"] = str(args.cache_dir)
-    if getattr(args, "data_dir", None):
-        os.environ["AUTOSVC_DATA_DIR"] = str(args.data_dir)
-    if getattr(args, "backups_dir", None):
-        os.environ["AUTOSVC_BACKUPS_DIR"] = str(args.backups_dir)
+    overrides = {
+        env: str(value)
+        for env, value in (
+            ("AUTOSVC_CONFIG_DIR", args.config_dir),
+            ("AUTOSVC_CACHE_DIR", args.cache_dir),
+            ("AUTOSVC_DATA_DIR", args.data_dir),
+            ("AUTOSVC_BACKUPS_DIR", args.backups_dir),
+        )
+        if value
+    }
+    if overrides:
+        os.environ.update(overrides)
+
+
+@lru_cache(maxsize=1)
+def _dirs() -> AutosvcDirs:
+    # Resolved once per process, after _apply_dir_overrides() has set the env.
+    return load_dirs()
 
 
 def _get_unsafe_password(args: argparse.Namespace) -> str:
@@ -994,23 +1069,21 @@ def _get_unsafe_password(args: argparse.Namespace) -> str:
     return prompt_password()
 
 
-def _logging_argv_from_args(args: argparse.Namespace) -> list[str]:
-    out: list[str] = []
-    if getattr(args, "trace", False):
-        out.append("--trace")
-    elif getattr(args, "verbose", False):
-        out.append("--verbose")
-    elif getattr(args, "log_level", None):
-        out.extend(["--log-level", str(args.log_level)])
-    if getattr(args, "log_file", None):
-        out.extend(["--log-file", str(args.log_file)])
-    if getattr(args, "log_dir", None):
-        out.extend(["--log-dir", str(args.log_dir)])
-    if getattr(args, "log_format", None):
-        out.extend(["--log-format", str(args.log_format)])
-    if getattr(args, "no_color", False):
-        out.append("--no-color")
-    return out
+@lru_cache(maxsize=None)
+def _parent(adders: tuple[_ArgAdder, ...]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=False)
+    for add_args in adders:
+        add_args(parser)
+    return parser
+
+
+def _parents(*adders: _ArgAdder) -> list[argparse.ArgumentParser]:
+    # One combined parent per adder combination: subparsers merge a single container.
+    return [_parent(adders)] if adders else []
+
+
+def _ecu_parents() -> list[argparse.ArgumentParser]:
+    return _parents(_add_logging_args, _add_can_args, _add_connect_arg, _add_can_id_mode_arg)
 
 
 def _add_can_args(parser: argparse.ArgumentParser) -> None:
@@ -1022,15 +1095,15 @@ def _add_connect_arg(parser: argparse.ArgumentParser) -> None:
 
 
 def _add_can_id_mode_arg(parser: argparse.ArgumentParser) -> None:
-    parser.add_argument("--can-id-mode", choices=["11bit", "29bit"], default="11bit")
+    parser.add_argument("--can-id-mode", choices=_CAN_ID_MODE_CHOICES, default="11bit")
 
 
 def _add_discovery_args(parser: argparse.ArgumentParser) -> None:
     _add_can_id_mode_arg(parser)
-    parser.add_argument("--addressing", choices=["functional", "physical", "both"], default="both")
+    parser.add_argument("--addressing", choices=_ADDRESSING_CHOICES, default="both")
     parser.add_argument("--timeout-ms", type=int, default=250)
     parser.add_argument("--retries", type=int, default=1)
-    parser.add_argument("--probe-session", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--probe-session", action=_BOOL_OPT, default=True)
 
 
 def _add_logging_args(parser: argparse.ArgumentParser) -> None:
@@ -1038,7 +1111,7 @@ def _add_logging_args(parser: argparse.ArgumentParser) -> None:
     # are not overwritten by subparser defaults.
     parser.add_argument(
         "--log-level",
-        choices=["error", "warning", "info", "debug", "trace"],
+        choices=_LOG_LEVEL_CHOICES,
         default=argparse.SUPPRESS,
         help="Logging level (default: info)",
     )
@@ -1063,7 +1136,7 @@ def _add_logging_args(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument(
         "--log-format",
-        choices=["pretty", "json"],
+        choices=_LOG_FORMAT_CHOICES,
         default=argparse.SUPPRESS,
         help="Log output format (default: pretty)",
     )
@@ -1090,18 +1163,138 @@ def _add_dir_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+# name -> (help, parent argument groups, builder for command-specific arguments)
+_COMMANDS: dict[str, tuple[str, tuple[_ArgAdder, ...], _ArgAdder | None]] = {
+    "scan": (
+        "Scan ECUs",
+        (_add_logging_args, _add_can_args, _add_connect_arg, _add_discovery_args),
+        None,
+    ),
+    "dtc": (
+        "DTC operations",
+        (),
+        _build_dtc_parser,
+    ),
+    "tui": (
+        "Run Textual TUI",
+        (_add_logging_args, _add_connect_arg, _add_can_id_mode_arg),
+        _build_tui_parser,
+    ),
+    "daemon": (
+        "Run Unix socket JSONL daemon",
+        (_add_logging_args,),
+        _build_daemon_parser,
+    ),
+    "topo": (
+        "Topology operations",
+        (_add_logging_args,),
+        _build_topo_parser,
+    ),
+    "did": (
+        "DID operations (ReadDataByIdentifier)",
+        (_add_logging_args,),
+        _build_did_parser,
+    ),
+    "security": (
+        "UDS SecurityAccess (0x27)",
+        (_add_logging_args,),
+        _build_security_parser,
+    ),
+    "watch": (
+        "Watch live DIDs and stream events (JSONL)",
+        (_add_logging_args, _add_can_args, _add_connect_arg, _add_can_id_mode_arg),
+        _build_watch_parser,
+    ),
+    "backup": (
+        "Manual backups (DID snapshots)",
+        (_add_logging_args,),
+        _build_backup_parser,
+    ),
+    "unsafe": (
+        "Unsafe mode password management",
+        (_add_logging_args,),
+        _build_unsafe_parser,
+    ),
+    "adapt": (
+        "Adaptations (dataset-driven, with backup/revert safety)",
+        (_add_logging_args,),
+        _build_adapt_parser,
+    ),
+    "coding": (
+        "Long coding (dataset-driven bitfields, with backup/revert safety)",
+        (_add_logging_args,),
+        _build_coding_parser,
+    ),
+}
+
+
 def _print_json(payload: dict[str, Any]) -> None:
-    sys.stdout.write(json.dumps(payload, sort_keys=True, indent=2) + "\n")
+    # Keys stay sorted for deterministic output; indent only for humans.
+    out = sys.stdout
+    if out.isatty():
+        # Indented encoding is pure Python either way; stream chunks instead of building one string.
+        json.dump(payload, out, sort_keys=True, indent=2)
+        out.write("\n")
+        out.flush()
+        return
+    # One-shot dumps keeps the C encoder, which streaming (iterencode) would bypass.
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    # ensure_ascii (the default) makes the payload plain ASCII bytes; one os.write when not teed.
+    _stdout_line_writer()(text.encode("ascii") + b"\n")
+
+
+def _write_stdout_bytes(data: bytes) -> None:
+    out = sys.stdout
+    buf = getattr(out, "buffer", None)
+    if buf is None:
+        # Replaced stdout without a binary layer (e.g. io.StringIO).
+        out.write(data.decode("utf-8"))
+        return
+    # Keep ordering with anything already written through the text layer.
+    out.flush()
+    buf.write(data)
+    buf.flush()
+
+
+def _stdout_line_writer() -> Callable[[bytes], None]:
+    # Streaming JSONL goes straight to fd 1 unless stdout was replaced (e.g. the --log-dir tee).
+    out = sys.stdout
+    out.flush()
+    if out is not sys.__stdout__:
+        return _write_stdout_bytes
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, ValueError):
+        return _write_stdout_bytes
+
+    def write_fd(data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    return write_fd
+
+
+@lru_cache(maxsize=8)
+def _ipc_client(sock_path: str) -> UnixJsonlClient:
+    # The client holds no socket between requests (the daemon serves one connection at a time),
+    # so caching it per path is safe and needs no cleanup.
+    from autosvc.ipc.unix_client import UnixJsonlClient
+
+    return UnixJsonlClient(sock_path)
 
 
 def _ipc_request(sock_path: str, payload: dict[str, Any]) -> dict[str, Any]:
-    client = UnixJsonlClient(sock_path)
     try:
-        return client.request(payload)
+        return _ipc_client(sock_path).request(payload)
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
 
 
+# (can_if, can_id_mode, datasets_dir, log_dir) -> live transport/service, see AUTOSVC_REUSE_TRANSPORT.
+_INPROCESS_CACHE: dict[tuple[str, str, str | None, str | None], tuple[SocketCanTransport, DiagnosticService]] = {}
+
+
 def _run_inprocess(
     can_if: str,
     *,
@@ -1126,60 +1319,72 @@ def _run_inprocess(
     security_key_hex: str | None = None,
     security_algo_module: str | None = None,
 ) -> dict[str, Any]:
+    from autosvc.core.service import DiagnosticService
+    from autosvc.core.transport.socketcan import SocketCanTransport
+    from autosvc.core.uds.did import parse_did
+
+    # Opt-in for callers that run several ops in one process; the CLI itself runs one op per process.
+    reuse = os.getenv("AUTOSVC_REUSE_TRANSPORT") == "1"
     transport: SocketCanTransport | None = None
+    service: DiagnosticService | None = None
     try:
-        transport = SocketCanTransport(channel=can_if, is_extended_id=(can_id_mode == "29bit"))
         # Resolve datasets_dir from env override (set by --data-dir), keep core CLI-agnostic.
         datasets_dir = os.getenv("AUTOSVC_DATA_DIR")
-        service = DiagnosticService(
-            transport,
-            can_interface=can_if,
-            can_id_mode=can_id_mode,
-            datasets_dir=datasets_dir,
-            log_dir=log_dir,
-        )
-        if op == "scan":
-            topo = service.scan_topology(
-                DiscoveryConfig(
-                    addressing=addressing,
-                    can_id_mode=can_id_mode,
-                    timeout_ms=timeout_ms,
-                    retries=retries,
-                    probe_session=probe_session,
-                )
+        cache_key = (can_if, can_id_mode, datasets_dir, log_dir)
+        cached = _INPROCESS_CACHE.get(cache_key) if reuse else None
+        if cached is not None:
+            transport, service = cached
+        else:
+            transport = SocketCanTransport(
+                channel=can_if,
+                is_extended_id=(can_id_mode == "29bit"),
+                rcvbuf=_CAN_RCVBUF,
+                sndbuf=_CAN_SNDBUF,
+            )
+            service = DiagnosticService(
+                transport,
+                can_interface=can_if,
+                can_id_mode=can_id_mode,
+                datasets_dir=datasets_dir,
+                log_dir=log_dir,
             )
-            nodes = [{"ecu": n.ecu, "ecu_name": getattr(n, "ecu_name", "Unknown ECU")} for n in topo.nodes]
-            return {"ok": True, "ecus": [n.ecu for n in topo.nodes], "nodes": nodes}
-        if op == "scan_topology":
+            if reuse:
+                if not _INPROCESS_CACHE:
+                    import atexit
+
+                    atexit.register(_close_inprocess_cache)
+                _INPROCESS_CACHE[cache_key] = (transport, service)
+        if op == "scan" or op == "scan_topology":
             topo = service.scan_topology(
-                DiscoveryConfig(
-                    addressing=addressing,
-                    can_id_mode=can_id_mode,
-                    timeout_ms=timeout_ms,
-                    retries=retries,
-                    probe_session=probe_session,
-                )
+                _make_discovery_config(addressing, can_id_mode, timeout_ms, retries, probe_session)
             )
-            return {"ok": True, "topology": topo.to_dict()}
+            if op == "scan_topology":
+                return {"ok": True, "topology": topo.to_dict()}
+            ecus: list[str] = []
+            nodes: list[dict[str, Any]] = []
+            for n in topo.nodes:
+                ecus.append(n.ecu)
+                nodes.append({"ecu": n.ecu, "ecu_name": getattr(n, "ecu_name", "Unknown ECU")})
+            return {"ok": True, "ecus": ecus, "nodes": nodes}
         if op == "read_dtcs":
-            assert ecu is not None
+            ecu = _require(ecu, "ecu")
             return {"ok": True, "dtcs": service.read_dtcs(ecu, with_freeze_frame=with_freeze_frame)}
         if op == "clear_dtcs":
-            assert ecu is not None
+            ecu = _require(ecu, "ecu")
             service.clear_dtcs(ecu)
             return {"ok": True}
         if op == "read_did":
-            assert ecu is not None
-            assert did is not None
+            ecu = _require(ecu, "ecu")
+            did = _require(did, "did")
             did_int = parse_did(did)
             return {"ok": True, "item": service.read_did(ecu, did_int)}
         if op == "security_seed":
-            assert ecu is not None
-            assert security_level is not None
+            ecu = _require(ecu, "ecu")
+            security_level = _require(security_level, "security_level")
             return {"ok": True, "result": service.security_request_seed(ecu, int(security_level))}
         if op == "security_unlock":
-            assert ecu is not None
-            assert security_level is not None
+            ecu = _require(ecu, "ecu")
+            security_level = _require(security_level, "security_level")
             return {
                 "ok": True,
                 "result": service.security_unlock(
@@ -1190,17 +1395,17 @@ def _run_inprocess(
                 ),
             }
         if op == "adapt_list":
-            assert ecu is not None
+            ecu = _require(ecu, "ecu")
             return {"ok": True, "ecu": str(ecu).upper(), "settings": service.list_adaptations(ecu)}
         if op == "adapt_read":
-            assert ecu is not None
-            assert key is not None
+            ecu = _require(ecu, "ecu")
+            key = _require(key, "key")
             return {"ok": True, "item": service.read_adaptation(ecu, key)}
         if op == "adapt_write":
-            assert ecu is not None
-            assert key is not None
-            assert value is not None
-            assert mode is not None
+            ecu = _require(ecu, "ecu")
+            key = _require(key, "key")
+            value = _require(value, "value")
+            mode = _require(mode, "mode")
             return {
                 "ok": True,
                 "result": service.write_adaptation(
@@ -1215,10 +1420,10 @@ def _run_inprocess(
                 ),
             }
         if op == "adapt_write_raw":
-            assert ecu is not None
-            assert did is not None
-            assert hex_payload is not None
-            assert mode is not None
+            ecu = _require(ecu, "ecu")
+            did = _require(did, "did")
+            hex_payload = _require(hex_payload, "hex_payload")
+            mode = _require(mode, "mode")
             did_int = parse_did(did)
             return {
                 "ok": True,
@@ -1234,29 +1439,29 @@ def _run_inprocess(
                 ),
             }
         if op == "adapt_backup":
-            assert ecu is not None
-            assert key is not None
+            ecu = _require(ecu, "ecu")
+            key = _require(key, "key")
             return {"ok": True, "result": service.backup_adaptation(ecu, key, notes=notes)}
         if op == "backup_did":
-            assert ecu is not None
-            assert did is not None
+            ecu = _require(ecu, "ecu")
+            did = _require(did, "did")
             did_int = parse_did(did)
             return {"ok": True, "result": service.backup_did(ecu, did_int, notes=notes)}
         if op == "adapt_revert":
-            assert backup_id is not None
+            backup_id = _require(backup_id, "backup_id")
             return {"ok": True, "result": service.revert_adaptation(backup_id)}
         if op == "coding_list":
-            assert ecu is not None
+            ecu = _require(ecu, "ecu")
             return {"ok": True, "ecu": str(ecu).upper(), "fields": service.list_coding_fields(ecu)}
         if op == "coding_read":
-            assert ecu is not None
-            assert key is not None
+            ecu = _require(ecu, "ecu")
+            key = _require(key, "key")
             return {"ok": True, "item": service.read_coding_field(ecu, key)}
         if op == "coding_write":
-            assert ecu is not None
-            assert key is not None
-            assert value is not None
-            assert mode is not None
+            ecu = _require(ecu, "ecu")
+            key = _require(key, "key")
+            value = _require(value, "value")
+            mode = _require(mode, "mode")
             return {
                 "ok": True,
                 "result": service.write_coding_field(
@@ -1271,10 +1476,10 @@ def _run_inprocess(
                 ),
             }
         if op == "coding_write_raw":
-            assert ecu is not None
-            assert did is not None
-            assert hex_payload is not None
-            assert mode is not None
+            ecu = _require(ecu, "ecu")
+            did = _require(did, "did")
+            hex_payload = _require(hex_payload, "hex_payload")
+            mode = _require(mode, "mode")
             did_int = parse_did(did)
             return {
                 "ok": True,
@@ -1290,18 +1495,63 @@ def _run_inprocess(
                 ),
             }
         if op == "coding_backup":
-            assert ecu is not None
-            assert key is not None
+            ecu = _require(ecu, "ecu")
+            key = _require(key, "key")
             return {"ok": True, "result": service.backup_coding_field(ecu, key, notes=notes)}
         if op == "coding_revert":
-            assert backup_id is not None
+            backup_id = _require(backup_id, "backup_id")
             return {"ok": True, "result": service.revert_coding(backup_id)}
         return {"ok": False, "error": "invalid operation"}
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
     finally:
-        if transport is not None:
+        if not reuse:
+            try:
+                if service is not None:
+                    service.close()
+            finally:
+                if transport is not None:
+                    transport.close()
+
+
+def _close_inprocess_cache() -> None:
+    while _INPROCESS_CACHE:
+        _, (transport, service) = _INPROCESS_CACHE.popitem()
+        try:
+            service.close()
+        except Exception:
+            log.debug("Service close failed", exc_info=True)
+        try:
             transport.close()
+        except Exception:
+            log.debug("Transport close failed", exc_info=True)
+
+
+def _require(value: _T | None, name: str) -> _T:
+    # Unlike assert, this check survives `python -O`.
+    if value is None:
+        raise ValueError(f"missing {name}")
+    return value
+
+
+@lru_cache(maxsize=None)
+def _make_discovery_config(
+    addressing: str,
+    can_id_mode: str,
+    timeout_ms: int,
+    retries: int,
+    probe_session: bool,
+) -> DiscoveryConfig:
+    # DiscoveryConfig is frozen, so identical settings can share one instance.
+    from autosvc.core.vehicle.discovery import DiscoveryConfig
+
+    return DiscoveryConfig(
+        addressing=addressing,
+        can_id_mode=can_id_mode,
+        timeout_ms=timeout_ms,
+        retries=retries,
+        probe_session=probe_session,
+    )
 
 
 def _print_adapt_list(resp: dict[str, Any]) -> None:
@@ -1448,85 +1698,140 @@ def _read_security_key_hex_from_args(args: argparse.Namespace) -> str | None:
     return None
 
 
-def _parse_watch_items(value: str) -> list[WatchItem]:
+def _parse_watch_items(value: str) -> tuple[WatchItem, ...]:
+    from autosvc.core.live.watch import WatchItem
+    from autosvc.core.uds.did import parse_did
+
     raw = (value or "").strip()
     if not raw:
         raise SystemExit("error: --items is required")
     items: list[WatchItem] = []
-    for part in raw.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        if ":" not in part:
+    for m in _WATCH_ITEM_RE.finditer(raw):
+        ecu, did = m.groups()
+        if did is None:
+            if not ecu:
+                continue
             raise SystemExit("error: invalid --items format (expected ECU:DID)")
-        ecu, did = part.split(":", 1)
-        ecu = ecu.strip().upper()
         try:
-            did_int = parse_did(did.strip())
+            did_int = parse_did(did)
         except Exception as exc:
             raise SystemExit("error: invalid DID in --items") from exc
-        items.append(WatchItem(ecu=ecu, did=did_int))
+        items.append(WatchItem(ecu=ecu.upper(), did=did_int))
     if not items:
         raise SystemExit("error: --items is required")
-    return items
+    return tuple(items)
 
 
 def _watch_inprocess(
     can_if: str,
     *,
     can_id_mode: str,
-    items: list[WatchItem],
+    items: tuple[WatchItem, ...],
     emit: str,
     tick_ms: int,
     ticks: int,
 ) -> None:
-    transport = SocketCanTransport(channel=can_if, is_extended_id=(can_id_mode == "29bit"))
+    from autosvc.core.live.watch import Watcher
+    from autosvc.core.service import DiagnosticService
+    from autosvc.core.transport.socketcan import SocketCanTransport
+
+    transport = SocketCanTransport(
+        channel=can_if,
+        is_extended_id=(can_id_mode == "29bit"),
+        rcvbuf=_CAN_RCVBUF,
+        sndbuf=_CAN_SNDBUF,
+    )
     service = DiagnosticService(transport, can_interface=can_if, can_id_mode=can_id_mode)
     try:
         watch = Watcher(service, items=items, emit_mode=emit, tick_ms=tick_ms)
+        encode = _EVENT_ENCODE
+        write = _stdout_line_writer()
+        # One output dict per (ecu, did), updated in place; name/unit come from the DID spec and do not change.
+        lines: dict[tuple[str, str], dict[str, object]] = {}
         for evt in watch.run_ticks(max_ticks=int(ticks), sleep=False):
-            sys.stdout.write(json.dumps(evt.to_dict(), sort_keys=True, separators=(",", ":")) + "\n")
-            sys.stdout.flush()
+            line = lines.get((evt.ecu, evt.did))
+            if line is None:
+                line = lines[(evt.ecu, evt.did)] = evt.to_dict()
+            else:
+                line["tick"] = evt.tick
+                line["value"] = evt.value
+            write(encode(line).encode("ascii") + b"\n")
     finally:
-        transport.close()
+        try:
+            service.close()
+        finally:
+            transport.close()
 
 
 def _watch_via_daemon(
     sock_path: str,
     *,
-    items: list[WatchItem],
+    items: tuple[WatchItem, ...],
     emit: str,
     tick_ms: int,
     ticks: int,
 ) -> None:
+    import socket
+
     payload = {
         "cmd": "watch_start",
-        "items": [{"ecu": it.ecu, "did": f"{int(it.did) & 0xFFFF:04X}"} for it in items],
+        # Items come from _parse_watch_items, so DIDs are already range-checked ints.
+        "items": [{"ecu": it.ecu, "did": f"{it.did:04X}"} for it in items],
         "emit": emit,
         "tick_ms": int(tick_ms),
         "max_ticks": int(ticks),
     }
-    data = (json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+    data = _COMPACT_ENCODE(payload).encode("ascii") + b"\n"
     with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        with contextlib.suppress(OSError):
+            # Room for bursts of events between our stdout writes.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 18)
         sock.settimeout(2.0)
         sock.connect(sock_path)
-        sock.sendall(data)
-        fileobj = sock.makefile("rb")
-        with fileobj:
-            while True:
-                line = fileobj.readline()
-                if not line:
-                    break
+        # The timeout only guards connect; a long watch may be quiet for longer.
+        sock.settimeout(None)
+        flags = getattr(socket, "MSG_NOSIGNAL", 0)
+        view = memoryview(data)
+        while view:
+            view = view[sock.send(view, flags) :]
+        encode = _COMPACT_ENCODE
+        write = _stdout_line_writer()
+        pending = b""
+        rbuf = bytearray(65536)
+        rview = memoryview(rbuf)
+        while True:
+            n = sock.recv_into(rbuf)
+            if not n:
+                break
+            lines = (pending + rview[:n]).split(b"\n")
+            pending = lines.pop()
+            if len(pending) > _WATCH_MAX_LINE:
+                # A well-behaved daemon never sends this; do not buffer without bound.
+                _print_json({"ok": False, "error": "daemon line too long"})
+                raise SystemExit(1)
+            # Everything complete in this chunk goes out in a single write.
+            out: list[bytes] = []
+            done = False
+            for line in lines:
+                if _LIVE_DID_MARKER in line:
+                    # The daemon already writes compact, sorted JSONL: forward the line as-is.
+                    out.append(line)
+                    continue
                 try:
-                    obj = json.loads(line.decode("utf-8"))
+                    obj = json.loads(line)
                 except Exception:
                     continue
                 if isinstance(obj, dict) and obj.get("event") == "live_did":
-                    sys.stdout.write(json.dumps(obj, sort_keys=True, separators=(",", ":")) + "\n")
-                    sys.stdout.flush()
+                    out.append(encode(obj).encode("ascii"))
                 if isinstance(obj, dict) and obj.get("ok") and obj.get("done"):
+                    done = True
                     break
+            if out:
+                write(b"\n".join(out) + b"\n")
+            if done:
+                return
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,23 +2,23 @@ from __future__ import annotations
 
 import argparse
 import logging
+import signal
 import sys
-import uuid
 
-from autosvc.core.service import DiagnosticService
-from autosvc.runlog import create_run_log_dir
-from autosvc.core.transport.socketcan import SocketCanTransport
-from autosvc.ipc.unix_server import JsonlUnixServer
 from autosvc.logging import TRACE_LEVEL, parse_log_level, setup_logging
 
 
 log = logging.getLogger(__name__)
 
+_LOG_LEVEL_CHOICES = ("error", "warning", "info", "debug", "trace")
+_LOG_FORMAT_CHOICES = ("pretty", "json")
+_CAN_ID_MODE_CHOICES = ("11bit", "29bit")
+
 
 def build_parser(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--log-level",
-        choices=["error", "warning", "info", "debug", "trace"],
+        choices=_LOG_LEVEL_CHOICES,
         default=None,
         help="Logging level (default: info)",
     )
@@ -30,11 +30,11 @@ def build_parser(parser: argparse.ArgumentParser) -> None:
         default=None,
         help="Optional directory to create a per-run log bundle (autosvc.log, metadata.json)",
     )
-    parser.add_argument("--log-format", choices=["pretty", "json"], default="pretty")
+    parser.add_argument("--log-format", choices=_LOG_FORMAT_CHOICES, default="pretty")
     parser.add_argument("--no-color", action="store_true", help="Disable ANSI colors in pretty logs")
 
     parser.add_argument("--can", default="vcan0", help="SocketCAN interface (e.g. can0, vcan0)")
-    parser.add_argument("--can-id-mode", choices=["11bit", "29bit"], default="11bit")
+    parser.add_argument("--can-id-mode", choices=_CAN_ID_MODE_CHOICES, default="11bit")
     parser.add_argument("--sock", default="/tmp/autosvc.sock", help="Unix socket path")
     parser.add_argument("--brand", default=None, help="Optional brand registry (e.g. vag)")
 
@@ -52,9 +52,13 @@ def main(argv: list[str] | None = None) -> None:
     else:
         level = parse_log_level(level_name)
 
-    trace_id = uuid.uuid4().hex[:12]
     log_file = getattr(args, "log_file", None)
     if getattr(args, "log_dir", None) and not log_file:
+        import uuid
+
+        from autosvc.runlog import create_run_log_dir
+
+        trace_id = uuid.uuid4().hex[:12]
         argv_for_meta = [parser.prog] + (list(argv) if argv is not None else sys.argv[1:])
         runlog = create_run_log_dir(str(args.log_dir), trace_id=trace_id, argv=argv_for_meta)
         log_file = str(runlog.log_path)
@@ -66,26 +70,46 @@ def main(argv: list[str] | None = None) -> None:
         no_color=bool(getattr(args, "no_color", False)),
     )
 
+    serve(can=args.can, can_id_mode=args.can_id_mode, sock=args.sock, brand=args.brand)
+
+
+def serve(*, can: str, can_id_mode: str, sock: str, brand: str | None = None) -> None:
+    """Run the daemon until interrupted; logging must already be configured."""
+    # The CAN/UDS stack is only imported once there is a daemon to run (not for --help).
+    from autosvc.core.service import DiagnosticService
+    from autosvc.core.transport.socketcan import SocketCanTransport
+    from autosvc.ipc.unix_server import JsonlUnixServer
+
     log.info(
         "Daemon starting",
-        extra={"can_interface": args.can, "can_id_mode": args.can_id_mode, "sock": args.sock, "brand": args.brand},
+        extra={"can_interface": can, "can_id_mode": can_id_mode, "sock": sock, "brand": brand},
     )
 
-    transport = SocketCanTransport(channel=args.can, is_extended_id=(args.can_id_mode == "29bit"))
+    transport = SocketCanTransport(channel=can, is_extended_id=(can_id_mode == "29bit"))
     service = DiagnosticService(
         transport,
-        brand=args.brand,
-        can_interface=args.can,
-        can_id_mode=args.can_id_mode,
+        brand=brand,
+        can_interface=can,
+        can_id_mode=can_id_mode,
     )
-    server = JsonlUnixServer(args.sock, service)
+    server = JsonlUnixServer(sock, service)
+
+    def _stop(signum: int, frame: object) -> None:
+        log.info("Daemon stopping", extra={"signal": signal.Signals(signum).name})
+        server.shutdown()
+
+    # SIGINT/SIGTERM stop the serve loop cleanly (socket file removed, CAN bus shut down).
+    previous = {sig: signal.signal(sig, _stop) for sig in (signal.SIGINT, signal.SIGTERM)}
     try:
         server.serve_forever()
-    except KeyboardInterrupt:
-        return None
     finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
         server.close()
-        transport.close()
+        try:
+            service.close()
+        finally:
+            transport.close()
 
 
 if __name__ == "__main__":
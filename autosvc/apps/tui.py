@@ -3,30 +3,52 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
-import uuid
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Protocol
-
-from autosvc.runlog import create_run_log_dir
+from functools import lru_cache
+from typing import Any, Callable, Protocol, TypeVar
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Footer, Header, Input, ListItem, ListView, Static
+from textual.worker import get_current_worker
 
 from autosvc.core.service import DiagnosticService
-from autosvc.core.transport.socketcan import SocketCanTransport
 from autosvc.core.vehicle.discovery import DiscoveryConfig
 from autosvc.core.vehicle.topology import EcuNode, Topology, ids_for_ecu
-from autosvc.ipc.unix_client import UnixJsonlClient
 from autosvc.logging import TRACE_LEVEL, parse_log_level, setup_logging
 
 
 log = logging.getLogger(__name__)
 
+_LOG_LEVEL_CHOICES = ("error", "warning", "info", "debug", "trace")
+_LOG_FORMAT_CHOICES = ("pretty", "json")
+_CAN_ID_MODE_CHOICES = ("11bit", "29bit")
+_ADDRESSING_CHOICES = ("functional", "physical", "both")
+
+_T = TypeVar("_T")
+_Row = tuple[str, ...]
+
+# Blocking API calls (UDS over CAN, or a daemon round-trip) run on Textual thread workers so the
+# UI keeps rendering. The transport/client underneath is not thread-safe, so calls are serialized.
+_API_LOCK = threading.Lock()
+
+# A scan result is reused for this long (repeated Scan presses); pass refresh=True to force a new scan.
+_TOPO_TTL_S = 5.0
+
+# After a failed daemon connection, IpcApi fails fast for a while (doubling up to the cap) instead of
+# re-dialing a dead socket on every live-data tick.
+_BACKOFF_MIN_S = 0.5
+_BACKOFF_MAX_S = 5.0
+
 
 class AutosvcApi(Protocol):
-    def scan_topology(self) -> Topology: ...
+    # The flag is True when a recent scan was reused instead of walking the bus again.
+    def scan_topology(self, *, refresh: bool = False) -> tuple[Topology, bool]: ...
     def read_dtcs(self, ecu: str, *, with_freeze_frame: bool = False) -> list[dict[str, object]]: ...
     def clear_dtcs(self, ecu: str) -> None: ...
     def read_dids(self, ecu: str, dids: list[int]) -> list[dict[str, object]]: ...
@@ -36,23 +58,51 @@ class AutosvcApi(Protocol):
     def revert_adaptation(self, backup_id: str) -> dict[str, object]: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _AppConfig:
     title: str
 
 
+class _TopologyCache:
+    __slots__ = ("_at", "_topo")
+
+    def __init__(self) -> None:
+        self._at = 0.0
+        self._topo: Topology | None = None
+
+    def get(self, scan: Callable[[], Topology], *, refresh: bool) -> tuple[Topology, bool]:
+        """Return (topology, cached): cached is True when the previous result was reused."""
+        if not refresh and self._topo is not None and time.monotonic() - self._at < _TOPO_TTL_S:
+            return self._topo, True
+        self._topo = scan()
+        self._at = time.monotonic()
+        return self._topo, False
+
+
 class InProcessApi:
+    __slots__ = ("_can_if", "_can_id_mode", "_addressing", "_transport", "_service", "_topo_cache")
+
     def __init__(self, can_if: str, *, can_id_mode: str, addressing: str) -> None:
         self._can_if = can_if
         self._can_id_mode = can_id_mode
         self._addressing = addressing
+        # Mode-specific imports: python-can is only needed in-process, the IPC client only with --connect.
+        from autosvc.core.transport.socketcan import SocketCanTransport
+
         self._transport = SocketCanTransport(channel=can_if, is_extended_id=(can_id_mode == "29bit"))
         self._service = DiagnosticService(self._transport, can_interface=can_if, can_id_mode=can_id_mode)
+        self._topo_cache = _TopologyCache()
 
     def close(self) -> None:
-        self._transport.close()
+        try:
+            self._service.close()
+        finally:
+            self._transport.close()
+
+    def scan_topology(self, *, refresh: bool = False) -> tuple[Topology, bool]:
+        return self._topo_cache.get(self._scan_topology, refresh=refresh)
 
-    def scan_topology(self) -> Topology:
+    def _scan_topology(self) -> Topology:
         return self._service.scan_topology(
             DiscoveryConfig(
                 addressing=self._addressing,
@@ -83,83 +133,197 @@ class InProcessApi:
 
 
 class IpcApi:
+    __slots__ = ("_client", "_can_id_mode", "_addressing", "_batch_read_dids", "_topo_cache", "_retry_at", "_backoff")
+
     def __init__(self, sock_path: str, *, can_id_mode: str, addressing: str) -> None:
+        from autosvc.ipc.unix_client import UnixJsonlClient
+
         self._client = UnixJsonlClient(sock_path)
         self._can_id_mode = can_id_mode
         self._addressing = addressing
+        # Older daemons only know per-DID `read_did`; flips off on the first "unknown cmd".
+        self._batch_read_dids = True
+        self._topo_cache = _TopologyCache()
+        self._retry_at = 0.0
+        self._backoff = 0.0
+
+    def _guarded(self, call: Callable[[Any], _T], arg: Any) -> _T:
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise RuntimeError(f"daemon unreachable (retrying in {self._retry_at - now:.1f}s)")
+        try:
+            out = call(arg)
+        except OSError:
+            self._backoff = min(_BACKOFF_MAX_S, self._backoff * 2) if self._backoff else _BACKOFF_MIN_S
+            self._retry_at = time.monotonic() + self._backoff
+            raise
+        self._backoff = 0.0
+        return out
+
+    def _request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return self._guarded(self._client.request, payload)
 
-    def scan_topology(self) -> Topology:
-        resp = self._client.request({"cmd": "scan_ecus"})
+    def scan_topology(self, *, refresh: bool = False) -> tuple[Topology, bool]:
+        return self._topo_cache.get(self._scan_topology, refresh=refresh)
+
+    def _scan_topology(self) -> Topology:
+        resp = self._request({"cmd": "scan_ecus"})
         _raise_on_error(resp)
         nodes_raw = resp.get("nodes")
         entries: list[tuple[str, str]] = []
         if isinstance(nodes_raw, list):
-            for item in nodes_raw:
-                if not isinstance(item, dict):
-                    continue
-                ecu = item.get("ecu")
-                ecu_name = item.get("ecu_name")
-                if isinstance(ecu, str):
-                    entries.append((ecu.upper(), str(ecu_name) if isinstance(ecu_name, str) else "Unknown ECU"))
+            entries = [e for e in map(_coerce_ecu_entry, nodes_raw) if e is not None]
         if not entries:
-            ecus = list(resp.get("ecus") or [])
-            for ecu in sorted({str(e).upper() for e in ecus}):
-                entries.append((ecu, "Unknown ECU"))
-
-        nodes: list[EcuNode] = []
-        for ecu, ecu_name in sorted(set(entries), key=lambda t: t[0]):
-            tx_id, rx_id = ids_for_ecu(ecu, self._can_id_mode)
-            nodes.append(
-                EcuNode(
-                    ecu=ecu,
-                    ecu_name=ecu_name,
-                    tx_id=tx_id,
-                    rx_id=rx_id,
-                    can_id_mode=self._can_id_mode,
-                    uds_confirmed=True,
-                    notes=["from:daemon"],
-                )
-            )
-        return Topology(
-            can_interface="daemon",
-            can_id_mode=self._can_id_mode,
-            addressing=self._addressing,
-            nodes=nodes,
-        )
+            entries = [(str(e).upper(), "Unknown ECU") for e in resp.get("ecus") or ()]
+        # One node per ECU; a reported name wins over the "Unknown ECU" placeholder.
+        merged: dict[str, str] = {}
+        for ecu, ecu_name in entries:
+            cur = merged.get(ecu)
+            if cur is None or cur == "Unknown ECU":
+                merged[ecu] = ecu_name
+        return _daemon_topology(tuple(sorted(merged.items())), self._can_id_mode, self._addressing)
 
     def read_dtcs(self, ecu: str, *, with_freeze_frame: bool = False) -> list[dict[str, object]]:
         # Freeze-frame is currently in-process only. Daemon protocol can be
         # extended later without changing the core API.
         _ = with_freeze_frame
-        resp = self._client.request({"cmd": "read_dtcs", "ecu": ecu})
+        resp = self._request({"cmd": "read_dtcs", "ecu": ecu})
         _raise_on_error(resp)
         return list(resp.get("dtcs") or [])
 
     def clear_dtcs(self, ecu: str) -> None:
-        resp = self._client.request({"cmd": "clear_dtcs", "ecu": ecu})
+        resp = self._request({"cmd": "clear_dtcs", "ecu": ecu})
         _raise_on_error(resp)
 
     def read_dids(self, ecu: str, dids: list[int]) -> list[dict[str, object]]:
+        key = (ecu, tuple(dids))
+        if self._batch_read_dids:
+            resp = self._request(_read_dids_request(key))
+            if resp.get("ok") or resp.get("error") != "unknown cmd":
+                _raise_on_error(resp)
+                return [item for item in resp.get("items") or [] if isinstance(item, dict)]
+            self._batch_read_dids = False
+
+        # Per-DID fallback, pipelined over one connection.
         out: list[dict[str, object]] = []
-        for did in dids:
-            resp = self._client.request({"cmd": "read_did", "ecu": ecu, "did": f"{int(did) & 0xFFFF:04X}"})
+        for resp in self._guarded(self._client.request_many, _read_did_requests(key)):
             _raise_on_error(resp)
             item = resp.get("item")
             if isinstance(item, dict):
                 out.append(item)
         return out
 
-    def list_adaptations(self, ecu: str) -> list[dict[str, object]]:
-        raise RuntimeError("adaptations are not available in daemon mode")
+    # The daemon protocol has no adaptation commands; these AutosvcApi methods fail on lookup.
+    _UNSUPPORTED = frozenset({"list_adaptations", "read_adaptation", "write_adaptation", "revert_adaptation"})
 
-    def read_adaptation(self, ecu: str, key: str) -> dict[str, object]:
-        raise RuntimeError("adaptations are not available in daemon mode")
+    def __getattr__(self, name: str) -> Any:
+        if name in IpcApi._UNSUPPORTED:
+            raise RuntimeError("adaptations are not available in daemon mode")
+        raise AttributeError(name)
 
-    def write_adaptation(self, ecu: str, key: str, value: str, *, mode: str) -> dict[str, object]:
-        raise RuntimeError("adaptations are not available in daemon mode")
 
-    def revert_adaptation(self, backup_id: str) -> dict[str, object]:
-        raise RuntimeError("adaptations are not available in daemon mode")
+# The live screen polls the same DID list every tick: build its request payloads once.
+# Callers only serialize them, never mutate.
+@lru_cache(maxsize=32)
+def _read_dids_request(key: tuple[str, tuple[int, ...]]) -> dict[str, Any]:
+    ecu, dids = key
+    return {"cmd": "read_dids", "ecu": ecu, "dids": [f"{int(did) & 0xFFFF:04X}" for did in dids]}
+
+
+@lru_cache(maxsize=32)
+def _read_did_requests(key: tuple[str, tuple[int, ...]]) -> list[dict[str, Any]]:
+    ecu = key[0]
+    return [{"cmd": "read_did", "ecu": ecu, "did": did} for did in _read_dids_request(key)["dids"]]
+
+
+def _coerce_ecu_entry(item: Any) -> tuple[str, str] | None:
+    """`scan_ecus` node -> (ECU, name); None for malformed entries."""
+    try:
+        ecu = item["ecu"]
+        ecu_name = item.get("ecu_name")
+    except (TypeError, KeyError, AttributeError):
+        return None
+    if not isinstance(ecu, str):
+        return None
+    return ecu.upper(), ecu_name if isinstance(ecu_name, str) else "Unknown ECU"
+
+
+@lru_cache(maxsize=4)
+def _daemon_topology(entries: tuple[tuple[str, str], ...], can_id_mode: str, addressing: str) -> Topology:
+    # Re-scans of an unchanged bus return the same (read-only) Topology instead of rebuilding it.
+    ids = [ids_for_ecu(ecu, can_id_mode) for ecu, _ in entries]
+    nodes = [
+        EcuNode(
+            ecu=ecu,
+            ecu_name=ecu_name,
+            tx_id=tx_id,
+            rx_id=rx_id,
+            can_id_mode=can_id_mode,
+            uds_confirmed=True,
+            notes=["from:daemon"],
+        )
+        for (ecu, ecu_name), (tx_id, rx_id) in zip(entries, ids)
+    ]
+    return Topology(
+        can_interface="daemon",
+        can_id_mode=can_id_mode,
+        addressing=addressing,
+        nodes=nodes,
+    )
+
+
+def _ecu_labels(topo: Topology) -> list[tuple[str, str]]:
+    return [
+        (
+            node.ecu,
+            f"{node.ecu}  {node.ecu_name}  tx=0x{node.tx_id:X}  rx=0x{node.rx_id:X}  "
+            f"uds={'yes' if node.uds_confirmed else 'no'}",
+        )
+        for node in topo.nodes
+    ]
+
+
+# Table rows are formatted on the worker thread; the UI thread only inserts them. Low-cardinality
+# columns (status, severity, unit, kind, risk) are interned so repeated values share one string.
+def _dtc_rows(dtcs: list[dict[str, object]]) -> tuple[list[dict[str, object]], list[_Row]]:
+    rows = [
+        (
+            str(item.get("code", "")),
+            sys.intern(str(item.get("status", ""))),
+            sys.intern(str(item.get("severity", ""))),
+            str(item.get("description", "")),
+        )
+        for item in dtcs
+    ]
+    return dtcs, rows
+
+
+def _live_rows(items: list[dict[str, object]]) -> list[_Row]:
+    return [
+        (
+            str(item.get("did", "")),
+            str(item.get("name", "")),
+            str(item.get("value", "")),
+            sys.intern(str(item.get("unit", ""))),
+        )
+        for item in items
+    ]
+
+
+def _adaptation_rows(settings: list[dict[str, object]]) -> tuple[list[dict[str, object]], list[_Row]]:
+    settings = list(settings or [])
+    rows = [
+        (
+            str(s.get("key") or ""),
+            str(s.get("label") or ""),
+            sys.intern(str(s.get("kind") or "")),
+            sys.intern(str(s.get("risk") or "")),
+            str(s.get("did") or ""),
+        )
+        for s in settings
+        if isinstance(s, dict)
+    ]
+    return settings, rows
 
 
 def _raise_on_error(resp: dict[str, Any]) -> None:
@@ -167,29 +331,43 @@ def _raise_on_error(resp: dict[str, Any]) -> None:
         raise RuntimeError(str(resp.get("error") or "unknown error"))
 
 
+def _run_api_call(
+    screen: Screen[Any],
+    status: Static,
+    call: Callable[[], _T],
+    done: Callable[[_T], None],
+    pending: Timer | None = None,
+) -> None:
+    """Worker-thread body: run `call` under the API lock, hand the result to `done` on the UI thread."""
+    worker = get_current_worker()
+    try:
+        with _API_LOCK:
+            if worker.is_cancelled:
+                return
+            result = call()
+    except Exception as exc:
+        if not worker.is_cancelled:
+            screen.app.call_from_thread(_settle, pending, status.update, f"Error: {exc}")
+        return
+    if not worker.is_cancelled:
+        screen.app.call_from_thread(_settle, pending, done, result)
+
+
+def _progress_status(screen: Screen[Any], status: Static, text: str) -> Timer:
+    # Only show "in progress" text if the call is still running after 50 ms; fast replies go
+    # straight to their final status without an intermediate repaint.
+    return screen.set_timer(0.05, lambda: status.update(text))
+
+
+def _settle(pending: Timer | None, fn: Callable[[_T], None], arg: _T) -> None:
+    if pending is not None:
+        pending.stop()
+    fn(arg)
+
+
 class AutosvcTui(App[None]):
-    CSS = """
-    Screen {
-        align: center middle;
-    }
-
-    #panel {
-        width: 90%;
-        height: 95%;
-        padding: 1;
-        border: solid $accent;
-    }
-
-    #title {
-        content-align: center middle;
-        height: 3;
-    }
-
-    #status {
-        height: 1;
-        color: $text-muted;
-    }
-    """
+    # Shipped next to this module; Textual resolves CSS_PATH relative to the class file.
+    CSS_PATH = "tui.tcss"
 
     def __init__(self, api: AutosvcApi, config: _AppConfig) -> None:
         super().__init__()
@@ -205,6 +383,9 @@ class AutosvcTui(App[None]):
 
 
 class EcuScanScreen(Screen[None]):
+    # Scan reuses a recent result (_TOPO_TTL_S); `r` always walks the bus again.
+    BINDINGS = [("r", "rescan", "Rescan")]
+
     def __init__(self, api: AutosvcApi, config: _AppConfig) -> None:
         super().__init__()
         self._api = api
@@ -216,8 +397,10 @@ class EcuScanScreen(Screen[None]):
             with Horizontal():
                 yield Button("Scan", id="scan")
                 yield Button("Quit", id="quit")
-            yield Static("", id="status")
-            yield ListView(id="ecu_list")
+            self._status = Static("", id="status")
+            yield self._status
+            self._ecu_list = ListView(id="ecu_list")
+            yield self._ecu_list
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "quit":
@@ -230,31 +413,35 @@ class EcuScanScreen(Screen[None]):
         ecu = str(event.item.data)
         self.app.push_screen(DtcScreen(self._api, ecu))
 
-    def _scan(self) -> None:
-        status = self.query_one("#status", Static)
-        status.update("Scanning...")
-        ecu_list = self.query_one("#ecu_list", ListView)
-        ecu_list.clear()
-        try:
-            topo = self._api.scan_topology()
-        except Exception as exc:
-            status.update(f"Error: {exc}")
-            return
-        if not topo.nodes:
-            status.update("No ECUs found.")
+    def action_rescan(self) -> None:
+        self._scan(refresh=True)
+
+    def _scan(self, *, refresh: bool = False) -> None:
+        self._ecu_list.clear()
+        self._scan_worker(refresh, _progress_status(self, self._status, "Scanning..."))
+
+    @work(exclusive=True, thread=True)
+    def _scan_worker(self, refresh: bool, pending: Timer) -> None:
+        _run_api_call(self, self._status, lambda: self._scan_labels(refresh), self._show_ecus, pending)
+
+    def _scan_labels(self, refresh: bool) -> tuple[list[tuple[str, str]], bool]:
+        topo, cached = self._api.scan_topology(refresh=refresh)
+        return _ecu_labels(topo), cached
+
+    def _show_ecus(self, result: tuple[list[tuple[str, str]], bool]) -> None:
+        labels, cached = result
+        note = " (cached; press r to rescan)" if cached else ""
+        if not labels:
+            self._status.update(f"No ECUs found.{note}")
             return
-        status.update(f"Found {len(topo.nodes)} ECU(s). Select one to view DTCs.")
-        for node in topo.nodes:
-            label = (
-                f"{node.ecu}  "
-                f"{node.ecu_name}  "
-                f"tx=0x{node.tx_id:X}  "
-                f"rx=0x{node.rx_id:X}  "
-                f"uds={'yes' if node.uds_confirmed else 'no'}"
-            )
+        self._status.update(f"Found {len(labels)} ECU(s). Select one to view DTCs.{note}")
+        items: list[ListItem] = []
+        for ecu, label in labels:
             item = ListItem(Static(label))
-            item.data = node.ecu
-            ecu_list.append(item)
+            item.data = ecu
+            items.append(item)
+        # One mount for the whole list instead of one per ECU.
+        self._ecu_list.extend(items)
 
 
 class DtcScreen(Screen[None]):
@@ -263,6 +450,13 @@ class DtcScreen(Screen[None]):
         self._api = api
         self._ecu = ecu
         self._dtcs: list[dict[str, object]] = []
+        self._button_actions: dict[str | None, Callable[[], object]] = {
+            "back": lambda: self.app.pop_screen(),
+            "refresh": self._refresh,
+            "clear": self._clear,
+            "live": lambda: self.app.push_screen(LiveScreen(self._api, self._ecu)),
+            "adapt": lambda: self.app.push_screen(AdaptationsScreen(self._api, self._ecu)),
+        }
 
     def compose(self) -> ComposeResult:
         yield Static(f"ECU {self._ecu}", id="title")
@@ -273,14 +467,14 @@ class DtcScreen(Screen[None]):
                 yield Button("Clear DTCs", id="clear")
                 yield Button("Live", id="live")
                 yield Button("Adapt", id="adapt")
-            yield Static("", id="status")
-            table = DataTable(id="dtc_table")
-            table.add_columns("Code", "Status", "Severity", "Description")
-            yield table
+            self._status = Static("", id="status")
+            yield self._status
+            self._table = DataTable(id="dtc_table")
+            self._table.add_columns("Code", "Status", "Severity", "Description")
+            yield self._table
 
     def on_mount(self) -> None:
-        table = self.query_one("#dtc_table", DataTable)
-        table.cursor_type = "row"
+        self._table.cursor_type = "row"
         self._refresh()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
@@ -292,52 +486,42 @@ class DtcScreen(Screen[None]):
         self.app.push_screen(DtcDetailScreen(self._ecu, self._dtcs[row]))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "back":
-            self.app.pop_screen()
-            return
-        if event.button.id == "refresh":
-            self._refresh()
-            return
-        if event.button.id == "clear":
-            self._clear()
-            return
-        if event.button.id == "live":
-            self.app.push_screen(LiveScreen(self._api, self._ecu))
-        if event.button.id == "adapt":
-            self.app.push_screen(AdaptationsScreen(self._api, self._ecu))
+        action = self._button_actions.get(event.button.id)
+        if action is not None:
+            action()
 
     def _refresh(self) -> None:
-        status = self.query_one("#status", Static)
-        status.update("Reading DTCs...")
-        table = self.query_one("#dtc_table", DataTable)
-        table.clear()
-        try:
-            dtcs = self._api.read_dtcs(self._ecu, with_freeze_frame=True)
-        except Exception as exc:
-            status.update(f"Error: {exc}")
-            return
+        self._table.clear()
+        self._refresh_worker(_progress_status(self, self._status, "Reading DTCs..."))
+
+    @work(exclusive=True, thread=True)
+    def _refresh_worker(self, pending: Timer) -> None:
+        _run_api_call(
+            self,
+            self._status,
+            lambda: _dtc_rows(self._api.read_dtcs(self._ecu, with_freeze_frame=True)),
+            self._show_dtcs,
+            pending,
+        )
+
+    def _show_dtcs(self, result: tuple[list[dict[str, object]], list[_Row]]) -> None:
+        dtcs, rows = result
         self._dtcs = list(dtcs)
         if not dtcs:
-            status.update("No DTCs.")
+            self._status.update("No DTCs.")
             return
-        status.update(f"{len(dtcs)} DTC(s).")
-        for item in dtcs:
-            table.add_row(
-                str(item.get("code", "")),
-                str(item.get("status", "")),
-                str(item.get("severity", "")),
-                str(item.get("description", "")),
-            )
+        self._status.update(f"{len(dtcs)} DTC(s).")
+        self._table.add_rows(rows)
 
     def _clear(self) -> None:
-        status = self.query_one("#status", Static)
-        status.update("Clearing DTCs...")
-        try:
-            self._api.clear_dtcs(self._ecu)
-        except Exception as exc:
-            status.update(f"Error: {exc}")
-            return
-        status.update("Cleared. Refreshing...")
+        self._clear_worker(_progress_status(self, self._status, "Clearing DTCs..."))
+
+    @work(thread=True, group="write")
+    def _clear_worker(self, pending: Timer) -> None:
+        _run_api_call(self, self._status, lambda: self._api.clear_dtcs(self._ecu), self._after_clear, pending)
+
+    def _after_clear(self, _: None) -> None:
+        self._status.update("Cleared. Refreshing...")
         self._refresh()
 
 
@@ -345,7 +529,7 @@ class DtcDetailScreen(Screen[None]):
     def __init__(self, ecu: str, dtc: dict[str, object]) -> None:
         super().__init__()
         self._ecu = ecu
-        self._dtc = dict(dtc)
+        self._dtc = dtc  # read-only view of the DtcScreen row; no copy needed
 
     def compose(self) -> ComposeResult:
         code = str(self._dtc.get("code") or "")
@@ -353,19 +537,20 @@ class DtcDetailScreen(Screen[None]):
         with Vertical(id="panel"):
             with Horizontal():
                 yield Button("Back", id="back")
-            yield Static("", id="status")
-            yield Static("", id="dtc_info")
-            table = DataTable(id="ff_table")
-            table.add_columns("DID", "Name", "Value", "Unit", "Raw")
-            yield table
+            self._status = Static("", id="status")
+            yield self._status
+            self._info = Static("", id="dtc_info")
+            yield self._info
+            self._table = DataTable(id="ff_table")
+            self._table.add_columns("DID", "Name", "Value", "Unit", "Raw")
+            yield self._table
 
     def on_mount(self) -> None:
-        info = self.query_one("#dtc_info", Static)
         code = str(self._dtc.get("code") or "")
         status = str(self._dtc.get("status") or "")
         severity = str(self._dtc.get("severity") or "")
         desc = str(self._dtc.get("description") or "")
-        info.update(f"{code}  status={status}  severity={severity}\n{desc}")
+        self._info.update(f"{code}  status={status}  severity={severity}\n{desc}")
         self._render_freeze_frame()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -373,28 +558,28 @@ class DtcDetailScreen(Screen[None]):
             self.app.pop_screen()
 
     def _render_freeze_frame(self) -> None:
-        status = self.query_one("#status", Static)
-        table = self.query_one("#ff_table", DataTable)
-        table.clear()
         ff = self._dtc.get("freeze_frame")
         if not isinstance(ff, dict):
-            status.update("No freeze-frame data.")
+            self._table.clear()
+            self._status.update("No freeze-frame data.")
             return
         record_id = ff.get("record_id")
-        status.update(f"Freeze-frame record {record_id}")
+        self._status.update(f"Freeze-frame record {record_id}")
         params = ff.get("parameters")
-        if not isinstance(params, list) or not params:
-            return
-        for p in params:
-            if not isinstance(p, dict):
-                continue
-            table.add_row(
+        rows = [
+            (
                 str(p.get("did") or ""),
                 str(p.get("name") or ""),
                 str(p.get("value") or ""),
                 str(p.get("unit") or ""),
                 str(p.get("raw") or ""),
             )
+            for p in (params if isinstance(params, list) else ())
+            if isinstance(p, dict)
+        ]
+        with self.app.batch_update():
+            self._table.clear()
+            self._table.add_rows(rows)
 
 
 class LiveScreen(Screen[None]):
@@ -405,6 +590,13 @@ class LiveScreen(Screen[None]):
         self._api = api
         self._ecu = ecu
         self._tick = 0
+        # Rows currently shown; row keys are their positions.
+        self._rows: list[_Row] = []
+        self._timer: Timer | None = None
+        # Set while a read is in flight; ticks that arrive meanwhile are skipped, not queued.
+        self._busy = False
+        # Bound once: the poll tick calls it twice a second.
+        self._read_dids = api.read_dids
 
     def compose(self) -> ComposeResult:
         yield Static(f"Live data (ECU {self._ecu})", id="title")
@@ -412,15 +604,25 @@ class LiveScreen(Screen[None]):
             with Horizontal():
                 yield Button("Back", id="back")
                 yield Button("Refresh", id="refresh")
-            yield Static("", id="status")
-            table = DataTable(id="live_table")
-            table.add_columns("DID", "Name", "Value", "Unit")
-            yield table
+            self._status = Static("", id="status")
+            yield self._status
+            self._table = DataTable(id="live_table")
+            self._columns = self._table.add_columns("DID", "Name", "Value", "Unit")
+            yield self._table
 
     def on_mount(self) -> None:
         self._refresh()
-        # Poll in a simple tick loop. This is synchronous and may block briefly.
-        self.set_interval(0.5, self._refresh)
+        # Poll in a simple tick loop; each read runs on a thread worker so the UI never blocks.
+        self._timer = self.set_interval(0.5, self._refresh)
+
+    def on_screen_suspend(self) -> None:
+        # Another screen is on top: stop polling the bus for a table nobody sees.
+        if self._timer is not None:
+            self._timer.pause()
+
+    def on_screen_resume(self) -> None:
+        if self._timer is not None:
+            self._timer.resume()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "back":
@@ -430,23 +632,42 @@ class LiveScreen(Screen[None]):
             self._refresh()
 
     def _refresh(self) -> None:
+        if self._busy:
+            return
+        self._busy = True
         self._tick += 1
-        status = self.query_one("#status", Static)
-        table = self.query_one("#live_table", DataTable)
-        status.update(f"Tick {self._tick}")
+        self._status.update(f"Tick {self._tick}")
+        self._refresh_worker()
+
+    @work(exclusive=True, thread=True)
+    def _refresh_worker(self) -> None:
         try:
-            items = self._api.read_dids(self._ecu, self._DIDS)
-        except Exception as exc:
-            status.update(f"Error: {exc}")
-            return
-        table.clear()
-        for item in items:
-            table.add_row(
-                str(item.get("did", "")),
-                str(item.get("name", "")),
-                str(item.get("value", "")),
-                str(item.get("unit", "")),
+            _run_api_call(
+                self,
+                self._status,
+                lambda: _live_rows(self._read_dids(self._ecu, self._DIDS)),
+                self._show_rows,
             )
+        finally:
+            self._busy = False
+
+    def _show_rows(self, rows: list[_Row]) -> None:
+        prev = self._rows
+        self._rows = rows
+        if [r[0] for r in rows] != [r[0] for r in prev]:
+            # First tick, or the DID list changed (e.g. a read error dropped rows): rebuild in one repaint.
+            with self.app.batch_update():
+                self._table.clear()
+                for i, row in enumerate(rows):
+                    self._table.add_row(*row, key=str(i))
+            return
+        # Steady state: touch only the cells whose text changed.
+        for i, (row, old) in enumerate(zip(rows, prev)):
+            if row == old:
+                continue
+            for column, new, before in zip(self._columns, row, old):
+                if new != before:
+                    self._table.update_cell(str(i), column, new)
 
 
 class ConfirmScreen(ModalScreen[bool]):
@@ -477,6 +698,12 @@ class AdaptationsScreen(Screen[None]):
         self._settings: list[dict[str, object]] = []
         self._selected_key: str | None = None
         self._last_backup_id: str | None = None
+        self._button_actions: dict[str | None, Callable[[], object]] = {
+            "back": lambda: self.app.pop_screen(),
+            "refresh": self._refresh,
+            "apply": self._apply,
+            "revert": self._revert,
+        }
 
     def compose(self) -> ComposeResult:
         yield Static(f"Adaptations (ECU {self._ecu})", id="title")
@@ -486,16 +713,17 @@ class AdaptationsScreen(Screen[None]):
                 yield Button("Refresh", id="refresh")
                 yield Button("Apply", id="apply")
                 yield Button("Revert", id="revert")
-            yield Static("", id="status")
-            table = DataTable(id="adapt_table")
-            table.add_columns("Key", "Label", "Kind", "Risk", "DID")
-            yield table
+            self._status = Static("", id="status")
+            yield self._status
+            self._table = DataTable(id="adapt_table")
+            self._table.add_columns("Key", "Label", "Kind", "Risk", "DID")
+            yield self._table
             yield Static("New value:")
-            yield Input(placeholder="Enter value (e.g. true/false/1/0)", id="adapt_value")
+            self._value_input = Input(placeholder="Enter value (e.g. true/false/1/0)", id="adapt_value")
+            yield self._value_input
 
     def on_mount(self) -> None:
-        table = self.query_one("#adapt_table", DataTable)
-        table.cursor_type = "row"
+        self._table.cursor_type = "row"
         self._refresh()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
@@ -510,81 +738,60 @@ class AdaptationsScreen(Screen[None]):
         self._read_selected()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "back":
-            self.app.pop_screen()
-            return
-        if event.button.id == "refresh":
-            self._refresh()
-            return
-        if event.button.id == "apply":
-            self._apply()
-            return
-        if event.button.id == "revert":
-            self._revert()
+        action = self._button_actions.get(event.button.id)
+        if action is not None:
+            action()
 
     def _refresh(self) -> None:
-        status = self.query_one("#status", Static)
-        status.update("Loading dataset settings...")
-        table = self.query_one("#adapt_table", DataTable)
-        table.clear()
+        self._table.clear()
         self._selected_key = None
-        try:
-            settings = self._api.list_adaptations(self._ecu)
-        except Exception as exc:
-            status.update(f"Error: {exc}")
-            return
-        self._settings = list(settings or [])
+        self._refresh_worker(_progress_status(self, self._status, "Loading dataset settings..."))
+
+    @work(exclusive=True, thread=True)
+    def _refresh_worker(self, pending: Timer) -> None:
+        _run_api_call(
+            self,
+            self._status,
+            lambda: _adaptation_rows(self._api.list_adaptations(self._ecu)),
+            self._show_settings,
+            pending,
+        )
+
+    def _show_settings(self, result: tuple[list[dict[str, object]], list[_Row]]) -> None:
+        self._settings, rows = result
         if not self._settings:
-            status.update("No adaptation settings for this ECU.")
+            self._status.update("No adaptation settings for this ECU.")
             return
-        status.update(f"{len(self._settings)} setting(s). Select one to read current value.")
-        for s in self._settings:
-            if not isinstance(s, dict):
-                continue
-            table.add_row(
-                str(s.get("key") or ""),
-                str(s.get("label") or ""),
-                str(s.get("kind") or ""),
-                str(s.get("risk") or ""),
-                str(s.get("did") or ""),
-            )
+        self._status.update(f"{len(self._settings)} setting(s). Select one to read current value.")
+        self._table.add_rows(rows)
 
     def _read_selected(self) -> None:
         if not self._selected_key:
             return
-        status = self.query_one("#status", Static)
-        try:
-            item = self._api.read_adaptation(self._ecu, self._selected_key)
-        except Exception as exc:
-            status.update(f"Error: {exc}")
-            return
+        self._read_worker(self._selected_key)
+
+    @work(exclusive=True, thread=True, group="read")
+    def _read_worker(self, key: str) -> None:
+        _run_api_call(self, self._status, lambda: self._api.read_adaptation(self._ecu, key), self._show_selected)
+
+    def _show_selected(self, item: dict[str, object]) -> None:
         if isinstance(item, dict):
-            status.update(
+            self._status.update(
                 f"{item.get('key')} = {item.get('value')} (raw={item.get('raw')}, kind={item.get('kind')}, risk={item.get('risk')})"
             )
 
     def _apply(self) -> None:
         if not self._selected_key:
-            self.query_one("#status", Static).update("Select a setting first.")
+            self._status.update("Select a setting first.")
             return
-        value = self.query_one("#adapt_value", Input).value
+        value = self._value_input.value
 
         def _after_confirm(ok: bool) -> None:
             if not ok:
-                self.query_one("#status", Static).update("Cancelled.")
-                return
-            status = self.query_one("#status", Static)
-            status.update("Writing...")
-            try:
-                result = self._api.write_adaptation(self._ecu, self._selected_key or "", value, mode="safe")
-            except Exception as exc:
-                status.update(f"Error: {exc}")
+                self._status.update("Cancelled.")
                 return
-            if isinstance(result, dict):
-                backup_id = result.get("backup_id")
-                self._last_backup_id = str(backup_id) if backup_id else None
-                status.update(f"Wrote. backup_id={backup_id}")
-                self._read_selected()
+            self._status.update("Writing...")
+            self._write_worker(self._selected_key or "", value)
 
         self.app.push_screen(
             ConfirmScreen(f"Write {self._selected_key} = {value} (safe mode)?"),
@@ -593,34 +800,56 @@ class AdaptationsScreen(Screen[None]):
 
     def _revert(self) -> None:
         if not self._last_backup_id:
-            self.query_one("#status", Static).update("No backup id available in this session.")
+            self._status.update("No backup id available in this session.")
             return
 
         backup_id = self._last_backup_id
 
         def _after_confirm(ok: bool) -> None:
             if not ok:
-                self.query_one("#status", Static).update("Cancelled.")
+                self._status.update("Cancelled.")
                 return
-            status = self.query_one("#status", Static)
-            status.update("Reverting...")
-            try:
-                result = self._api.revert_adaptation(backup_id)
-            except Exception as exc:
-                status.update(f"Error: {exc}")
-                return
-            status.update(f"Reverted backup_id={backup_id}")
-            _ = result
-            self._read_selected()
+            self._status.update("Reverting...")
+            self._revert_worker(backup_id)
 
         self.app.push_screen(ConfirmScreen(f"Revert backup_id={backup_id}?"), _after_confirm)
 
+    # Writes are not exclusive: a later refresh must not drop the result of a write already on the bus.
+    @work(thread=True, group="write")
+    def _write_worker(self, key: str, value: str) -> None:
+        _run_api_call(
+            self,
+            self._status,
+            lambda: self._api.write_adaptation(self._ecu, key, value, mode="safe"),
+            self._after_write,
+        )
+
+    def _after_write(self, result: dict[str, object]) -> None:
+        if isinstance(result, dict):
+            backup_id = result.get("backup_id")
+            self._last_backup_id = str(backup_id) if backup_id else None
+            self._status.update(f"Wrote. backup_id={backup_id}")
+            self._read_selected()
+
+    @work(thread=True, group="write")
+    def _revert_worker(self, backup_id: str) -> None:
+        _run_api_call(
+            self,
+            self._status,
+            lambda: self._api.revert_adaptation(backup_id),
+            lambda _: self._after_revert(backup_id),
+        )
+
+    def _after_revert(self, backup_id: str) -> None:
+        self._status.update(f"Reverted backup_id={backup_id}")
+        self._read_selected()
+
 
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="autosvc Textual TUI")
     parser.add_argument(
         "--log-level",
-        choices=["error", "warning", "info", "debug", "trace"],
+        choices=_LOG_LEVEL_CHOICES,
         default=None,
         help="Logging level (default: info)",
     )
@@ -632,13 +861,13 @@ def main(argv: list[str] | None = None) -> None:
         default=None,
         help="Optional directory to create a per-run log bundle (autosvc.log, metadata.json)",
     )
-    parser.add_argument("--log-format", choices=["pretty", "json"], default="pretty")
+    parser.add_argument("--log-format", choices=_LOG_FORMAT_CHOICES, default="pretty")
     parser.add_argument("--no-color", action="store_true", help="Disable ANSI colors in pretty logs")
 
     parser.add_argument("--can", default=None, help="SocketCAN interface (in-process mode, e.g. vcan0)")
     parser.add_argument("--connect", default=None, help="Unix socket path (daemon mode)")
-    parser.add_argument("--can-id-mode", choices=["11bit", "29bit"], default="11bit")
-    parser.add_argument("--addressing", choices=["functional", "physical", "both"], default="both")
+    parser.add_argument("--can-id-mode", choices=_CAN_ID_MODE_CHOICES, default="11bit")
+    parser.add_argument("--addressing", choices=_ADDRESSING_CHOICES, default="both")
     args = parser.parse_args(argv)
 
     level_name: str | None = getattr(args, "log_level", None)
@@ -649,9 +878,13 @@ def main(argv: list[str] | None = None) -> None:
     else:
         level = parse_log_level(level_name)
 
-    trace_id = uuid.uuid4().hex[:12]
     log_file = getattr(args, "log_file", None)
     if getattr(args, "log_dir", None) and not log_file:
+        import uuid
+
+        from autosvc.runlog import create_run_log_dir
+
+        trace_id = uuid.uuid4().hex[:12]
         argv_for_meta = [parser.prog] + (list(argv) if argv is not None else sys.argv[1:])
         runlog = create_run_log_dir(str(args.log_dir), trace_id=trace_id, argv=argv_for_meta)
         log_file = str(runlog.log_path)
@@ -663,16 +896,21 @@ def main(argv: list[str] | None = None) -> None:
         no_color=bool(getattr(args, "no_color", False)),
     )
 
+    run(connect=args.connect, can=args.can, can_id_mode=args.can_id_mode, addressing=args.addressing)
+
+
+def run(*, connect: str | None, can: str | None, can_id_mode: str, addressing: str) -> None:
+    """Run the TUI against a daemon (`connect`) or in-process; logging must already be configured."""
     config = _AppConfig(title="autosvc")
 
     api: AutosvcApi
     inproc: InProcessApi | None = None
     try:
-        if args.connect:
-            api = IpcApi(args.connect, can_id_mode=args.can_id_mode, addressing=args.addressing)
+        if connect:
+            api = IpcApi(connect, can_id_mode=can_id_mode, addressing=addressing)
         else:
-            can_if = args.can or "vcan0"
-            inproc = InProcessApi(can_if, can_id_mode=args.can_id_mode, addressing=args.addressing)
+            can_if = can or "vcan0"
+            inproc = InProcessApi(can_if, can_id_mode=can_id_mode, addressing=addressing)
             api = inproc
         AutosvcTui(api, config).run()
     except Exception as exc:
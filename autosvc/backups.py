@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import binascii
 import json
 import os
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from autosvc.config import AutosvcDirs, load_dirs
 
@@ -29,6 +30,12 @@ def _default_backups_dir(dirs: AutosvcDirs | None = None) -> Path:
     return d.backups_dir
 
 
+def _hex_upper(data: bytes) -> str:
+    # Upper-casing the ASCII bytes is cheaper than str.upper() on bytes.hex(); it adds up on
+    # multi-KB snapshots.
+    return binascii.hexlify(data).upper().decode("ascii")
+
+
 @dataclass(frozen=True)
 class BackupRecord:
     """A persisted backup record.
@@ -50,18 +57,19 @@ class BackupRecord:
     notes: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
+        # Keys are inserted in sorted order, so the serialized form is canonical without sort_keys.
         out: dict[str, Any] = {
             "backup_id": self.backup_id,
-            "kind": self.kind,
-            "ecu": self.ecu,
             "did": f"{int(self.did) & 0xFFFF:04X}",
+            "ecu": self.ecu,
             "key": self.key,
-            "notes": self.notes,
+            "kind": self.kind,
         }
-        if self.old_hex is not None:
-            out["old_hex"] = self.old_hex
         if self.new_hex is not None:
             out["new_hex"] = self.new_hex
+        out["notes"] = self.notes
+        if self.old_hex is not None:
+            out["old_hex"] = self.old_hex
         if self.raw_hex is not None:
             out["raw_hex"] = self.raw_hex
         return out
@@ -71,6 +79,27 @@ class BackupStore:
     def __init__(self, root: Path | None = None, *, dirs: AutosvcDirs | None = None) -> None:
         self._dirs = dirs
         self._root = Path(root) if root is not None else _default_backups_dir(dirs)
+        # Append handles for index.jsonl and per-run bundle indexes, opened on first use.
+        self._idx_fh: TextIO | None = None
+        self._bundle_fhs: dict[Path, TextIO] = {}
+
+    def __enter__(self) -> BackupStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        fhs = list(self._bundle_fhs.values())
+        if self._idx_fh is not None:
+            fhs.append(self._idx_fh)
+        self._idx_fh = None
+        self._bundle_fhs.clear()
+        for fh in fhs:
+            try:
+                fh.close()
+            except OSError:
+                pass
 
     @property
     def root(self) -> Path:
@@ -92,8 +121,8 @@ class BackupStore:
             ecu=ecu,
             did=did,
             key=key,
-            old_hex=old.hex().upper(),
-            new_hex=new.hex().upper(),
+            old_hex=_hex_upper(old),
+            new_hex=_hex_upper(new),
             raw_hex=None,
             notes=notes,
             copy_to_log_dir=copy_to_log_dir,
@@ -116,7 +145,7 @@ class BackupStore:
             key=key,
             old_hex=None,
             new_hex=None,
-            raw_hex=raw.hex().upper(),
+            raw_hex=_hex_upper(raw),
             notes=notes,
             copy_to_log_dir=copy_to_log_dir,
         )
@@ -148,15 +177,16 @@ class BackupStore:
             notes=str(notes) if isinstance(notes, str) and notes else None,
         )
 
-        record_path = self._record_path(backup_id)
-        record_path.write_text(json.dumps(record.to_dict(), sort_keys=True, indent=2) + "\n", encoding="utf-8")
+        # One serialization, shared by the record file and every index line.
+        line = json.dumps(record.to_dict(), separators=(",", ":")) + "\n"
+        self._write_record(self._record_path(backup_id), line.encode("utf-8"))
+
+        self._get_idx().write(line)
 
-        idx_path = self._index_path()
-        with idx_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record.to_dict(), sort_keys=True, separators=(",", ":")) + "\n")
+        self._store_next_id(int(backup_id) + 1)
 
         if copy_to_log_dir is not None:
-            self._copy_to_log_bundle(record, copy_to_log_dir)
+            self._copy_to_log_bundle(record, line, copy_to_log_dir)
 
         return record
 
@@ -213,9 +243,63 @@ class BackupStore:
     def _index_path(self) -> Path:
         return self._root / "index.jsonl"
 
+    def _write_record(self, path: Path, data: bytes) -> None:
+        # Write to a sibling and rename, so a crash never leaves a truncated record behind.
+        tmp = path.with_suffix(".json.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _get_idx(self) -> TextIO:
+        # Line-buffered: every record reaches the file as soon as it is written.
+        if self._idx_fh is None:
+            self._idx_fh = self._index_path().open("a", encoding="utf-8", buffering=1)
+        return self._idx_fh
+
+    def _counter_path(self) -> Path:
+        return self._root / ".next_id"
+
     def _next_id(self) -> str:
-        # Find last backup_id from index.jsonl (last line), deterministic and
-        # does not require a separate index counter file.
+        # Fast path: the counter written after each backup. Fall back to the index tail for stores
+        # without a counter, or when the counter lags behind a record that already exists.
+        nxt = self._load_next_id()
+        if nxt is None or self._record_path(f"{nxt:06d}").exists():
+            nxt = self._last_indexed_id() + 1
+        return f"{nxt:06d}"
+
+    def _load_next_id(self) -> int | None:
+        try:
+            text = self._counter_path().read_text(encoding="ascii").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        return int(text) if text.isdigit() else None
+
+    def _store_next_id(self, nxt: int) -> None:
+        # Atomic replace so a crash never leaves a torn counter; best-effort, since _next_id can
+        # always rebuild it from index.jsonl.
+        path = self._counter_path()
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_text(f"{nxt:06d}\n", encoding="ascii")
+            os.replace(tmp, path)
+        except OSError:
+            return None
+
+    def _last_indexed_id(self) -> int:
+        # Last backup_id from index.jsonl (last line).
         idx = self._index_path()
         last = 0
         if idx.exists():
@@ -235,10 +319,9 @@ class BackupStore:
                         last = int(str(obj.get("backup_id")))
             except Exception:
                 last = 0
-        nxt = last + 1
-        return f"{nxt:06d}"
+        return last
 
-    def _copy_to_log_bundle(self, record: BackupRecord, log_dir: Path) -> None:
+    def _copy_to_log_bundle(self, record: BackupRecord, line: str, log_dir: Path) -> None:
         # Keep backups grouped.
         bdir = Path(log_dir) / "backups"
         bdir.mkdir(parents=True, exist_ok=True)
@@ -254,7 +337,9 @@ class BackupStore:
         # Also append to a per-run index.
         idx = bdir / "index.jsonl"
         try:
-            with idx.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record.to_dict(), sort_keys=True, separators=(",", ":")) + "\n")
+            f = self._bundle_fhs.get(idx)
+            if f is None:
+                f = self._bundle_fhs[idx] = idx.open("a", encoding="utf-8", buffering=1)
+            f.write(line)
         except Exception:
             return
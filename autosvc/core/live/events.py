@@ -13,14 +13,13 @@ class LiveDidEvent:
     unit: str
 
     def to_dict(self) -> dict[str, object]:
-        # Keep key order stable for golden snapshots and JSONL streaming.
+        # Keys are listed in sorted order so JSONL writers can skip sort_keys and stay byte-identical.
         return {
-            "event": "live_did",
-            "tick": int(self.tick),
-            "ecu": self.ecu,
             "did": self.did,
+            "ecu": self.ecu,
+            "event": "live_did",
             "name": self.name,
-            "value": self.value,
+            "tick": int(self.tick),
             "unit": self.unit,
+            "value": self.value,
         }
-
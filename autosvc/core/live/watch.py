@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Sequence
 
 from autosvc.core.live.events import LiveDidEvent
 from autosvc.core.service import DiagnosticService
@@ -23,12 +23,13 @@ class Watcher:
         self,
         service: DiagnosticService,
         *,
-        items: list[WatchItem],
+        items: Sequence[WatchItem],
         emit_mode: EmitMode = "changed",
         tick_ms: int = 200,
     ) -> None:
         self._service = service
-        self._items = items
+        # Validate DIDs once up front so the tick loop does no parsing.
+        self._items: tuple[WatchItem, ...] = tuple(WatchItem(ecu=it.ecu, did=parse_did(it.did)) for it in items)
         self._emit_mode: EmitMode = emit_mode
         self._tick_ms = int(tick_ms)
         self._last: dict[tuple[str, str], object] = {}
@@ -36,8 +37,7 @@ class Watcher:
     def tick(self, tick: int) -> list[LiveDidEvent]:
         events: list[LiveDidEvent] = []
         for item in self._items:
-            did_int = parse_did(item.did)
-            reading = self._service.read_did(item.ecu, did_int)
+            reading = self._service.read_did(item.ecu, item.did)
             evt = LiveDidEvent(
                 tick=int(tick),
                 ecu=str(reading.get("ecu", "")),
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from autosvc.core.dtc.decode import decode_dtcs
@@ -13,7 +14,7 @@ from autosvc.core.uds.adaptations import AdaptationsManager
 from autosvc.core.uds.longcoding import LongCodingManager
 from autosvc.core.uds.did import decode_did, format_did, parse_did, read_did as _uds_read_did
 from autosvc.core.uds.freeze_frame import FreezeFrameError, list_snapshot_identification, read_snapshot_record
-from autosvc.core.vehicle.discovery import DiscoveryConfig
+from autosvc.core.vehicle.discovery import DiscoveryConfig, default_config
 from autosvc.core.vehicle.discovery import scan_topology as _scan_topology
 from autosvc.core.vehicle.topology import Topology
 
@@ -45,12 +46,17 @@ class DiagnosticService:
         self._longcoding: LongCodingManager | None = None
         self._backups: BackupStore | None = None
 
+    def close(self) -> None:
+        """Release the backup store's open index files. The transport belongs to the caller."""
+        if self._backups is not None:
+            self._backups.close()
+
     def scan_ecus(self) -> list[str]:
         log.info(
             "Scanning ECUs",
             extra={"can_interface": self._can_interface, "can_id_mode": self._can_id_mode, "brand": self._brand},
         )
-        topo = self.scan_topology(DiscoveryConfig(can_id_mode=self._can_id_mode))
+        topo = self.scan_topology(default_config(self._can_id_mode))
         return [node.ecu for node in topo.nodes]
 
     def scan_topology(self, config: DiscoveryConfig) -> Topology:
@@ -398,6 +404,11 @@ class DiagnosticService:
 def _normalize_ecu(value: str) -> str:
     if not isinstance(value, str):
         raise ValueError("ecu must be hex string")
+    return _normalize_ecu_str(value)
+
+
+@lru_cache(maxsize=128)
+def _normalize_ecu_str(value: str) -> str:
     raw = value.strip()
     if not raw:
         raise ValueError("ecu must be hex string")
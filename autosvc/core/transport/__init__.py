@@ -4,7 +4,6 @@ from autosvc.core.transport.base import CanFrame, CanTransport
 from autosvc.core.transport.mock import MockTransport
 from autosvc.core.transport.recorder import RecordingTransport
 from autosvc.core.transport.replay import ReplayError, ReplayTransport
-from autosvc.core.transport.socketcan import SocketCanTransport
 
 __all__ = [
     "CanFrame",
@@ -16,3 +15,11 @@ __all__ = [
     "SocketCanTransport",
 ]
 
+
+def __getattr__(name: str) -> object:
+    if name != "SocketCanTransport":
+        raise AttributeError(name)
+    # python-can is slow to import; only load it when a real CAN bus is requested.
+    from autosvc.core.transport.socketcan import SocketCanTransport
+
+    return SocketCanTransport
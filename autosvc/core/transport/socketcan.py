@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import socket
 
 import can
 
@@ -11,10 +12,31 @@ log = logging.getLogger(__name__)
 
 
 class SocketCanTransport(CanTransport):
-    def __init__(self, channel: str = "vcan0", *, is_extended_id: bool = False) -> None:
+    def __init__(
+        self,
+        channel: str = "vcan0",
+        *,
+        is_extended_id: bool = False,
+        rcvbuf: int | None = None,
+        sndbuf: int | None = None,
+    ) -> None:
         self.channel = channel
         self._is_extended_id = bool(is_extended_id)
         self._bus = can.interface.Bus(channel=channel, interface="socketcan")
+        if rcvbuf:
+            self._set_sockbuf(socket.SO_RCVBUF, rcvbuf)
+        if sndbuf:
+            self._set_sockbuf(socket.SO_SNDBUF, sndbuf)
+
+    def _set_sockbuf(self, opt: int, size: int) -> None:
+        # Best-effort: the kernel may clamp the value (net.core.rmem_max/wmem_max).
+        sock = getattr(self._bus, "socket", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, opt, int(size))
+        except OSError as exc:
+            log.debug("SocketCAN buffer size not applied", extra={"can_interface": self.channel, "error": str(exc)})
 
     def send(self, can_id: int, data: bytes) -> None:
         if log.isEnabledFor(5):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 from autosvc.core.uds.client import UdsClient, UdsError
@@ -48,12 +49,7 @@ def parse_did(value: str | int) -> int:
     if isinstance(value, int):
         did = value
     elif isinstance(value, str):
-        raw = value.strip().lower()
-        if raw.startswith("0x"):
-            raw = raw[2:]
-        if not raw:
-            raise ValueError("did must be hex string")
-        did = int(raw, 16)
+        return _parse_did_str(value)
     else:
         raise ValueError("did must be hex string")
     if did < 0 or did > 0xFFFF:
@@ -61,6 +57,20 @@ def parse_did(value: str | int) -> int:
     return did
 
 
+@lru_cache(maxsize=256)
+def _parse_did_str(value: str) -> int:
+    # The same few DID strings repeat across CLI/IPC calls; failures are not cached.
+    raw = value.strip().lower()
+    if raw.startswith("0x"):
+        raw = raw[2:]
+    if not raw:
+        raise ValueError("did must be hex string")
+    did = int(raw, 16)
+    if did < 0 or did > 0xFFFF:
+        raise ValueError("did out of range")
+    return did
+
+
 def read_did(uds: UdsClient, did: int) -> bytes:
     did_int = int(did) & 0xFFFF
     request_data = bytes([(did_int >> 8) & 0xFF, did_int & 0xFF])
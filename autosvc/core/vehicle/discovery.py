@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal
 
 from autosvc.core.isotp.transport import IsoTpError, IsoTpTimeoutError, IsoTpTransport
@@ -13,7 +14,7 @@ AddressingMode = Literal["functional", "physical", "both"]
 CanIdMode = Literal["11bit", "29bit"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscoveryConfig:
     addressing: AddressingMode = "both"
     can_id_mode: CanIdMode = "11bit"
@@ -26,6 +27,12 @@ class DiscoveryConfig:
     functional_id_29: int = 0x18DB33F1
 
 
+@lru_cache(maxsize=None)
+def default_config(can_id_mode: CanIdMode = "11bit") -> DiscoveryConfig:
+    """Shared default DiscoveryConfig for a CAN ID mode (the config is immutable)."""
+    return DiscoveryConfig(can_id_mode=can_id_mode)
+
+
 @dataclass
 class _NodeAcc:
     ecu: str
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 _TESTER_SOURCE_ADDRESS_29 = 0xF1
@@ -45,6 +46,8 @@ class Topology:
         }
 
 
+# Pure and called per ECU on every scan (discovery and the TUI's daemon topology).
+@lru_cache(maxsize=512)
 def ids_for_ecu(ecu: str, can_id_mode: str) -> tuple[int, int]:
     ecu_int = int(ecu, 16)
     if ecu_int < 0 or ecu_int > 0xFF:
@@ -1,7 +1,22 @@
 from __future__ import annotations
 
-from autosvc.ipc.unix_client import UnixJsonlClient
-from autosvc.ipc.unix_server import JsonlUnixServer
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from autosvc.ipc.unix_client import UnixJsonlClient
+    from autosvc.ipc.unix_server import JsonlUnixServer
 
 __all__ = ["JsonlUnixServer", "UnixJsonlClient"]
 
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily: clients must not pay for importing the server (and core) side.
+    if name == "UnixJsonlClient":
+        from autosvc.ipc.unix_client import UnixJsonlClient
+
+        return UnixJsonlClient
+    if name == "JsonlUnixServer":
+        from autosvc.ipc.unix_server import JsonlUnixServer
+
+        return JsonlUnixServer
+    raise AttributeError(name)
@@ -6,18 +6,23 @@ from typing import Any
 
 from autosvc.core.service import DiagnosticService
 from autosvc.core.uds.did import parse_did
-from autosvc.core.vehicle.discovery import DiscoveryConfig
+from autosvc.core.vehicle.discovery import default_config
 
 
 log = logging.getLogger(__name__)
 
 
+# IPC is JSONL; keep it compact but deterministic. One encoder instance for all lines.
+_ENCODE = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+
+
 def decode_json_line(line: bytes) -> dict[str, Any]:
     try:
-        text = line.decode("utf-8").strip()
+        text = line.decode("utf-8")
     except UnicodeDecodeError as exc:
         raise ValueError("invalid utf-8") from exc
-    if not text:
+    # json.loads skips surrounding whitespace itself; no stripped copy needed.
+    if not text or text.isspace():
         raise ValueError("empty request")
     try:
         raw = json.loads(text)
@@ -29,8 +34,8 @@ def decode_json_line(line: bytes) -> dict[str, Any]:
 
 
 def encode_json_line(payload: dict[str, Any]) -> bytes:
-    # IPC is JSONL; keep it compact but deterministic.
-    return (json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+    # ensure_ascii output is plain ASCII, so the bytes are also valid UTF-8.
+    return _ENCODE(payload).encode("ascii") + b"\n"
 
 
 def error(message: str) -> dict[str, Any]:
@@ -47,9 +52,12 @@ def handle_request(request: dict[str, Any], service: DiagnosticService) -> dict[
     if cmd == "scan_ecus":
         # Keep the original `ecus` list for compatibility, but include lightweight node metadata.
         can_id_mode = str(getattr(service, "_can_id_mode", "11bit"))
-        topo = service.scan_topology(DiscoveryConfig(can_id_mode=can_id_mode))
-        ecus = [n.ecu for n in topo.nodes]
-        nodes = [{"ecu": n.ecu, "ecu_name": getattr(n, "ecu_name", "Unknown ECU")} for n in topo.nodes]
+        topo = service.scan_topology(default_config(can_id_mode))
+        ecus: list[str] = []
+        nodes: list[dict[str, Any]] = []
+        for n in topo.nodes:
+            ecus.append(n.ecu)
+            nodes.append({"ecu": n.ecu, "ecu_name": getattr(n, "ecu_name", "Unknown ECU")})
         return {"ok": True, "ecus": ecus, "nodes": nodes}
 
     if cmd == "read_dtcs":
@@ -78,4 +86,19 @@ def handle_request(request: dict[str, Any], service: DiagnosticService) -> dict[
         item = service.read_did(ecu, did_int)
         return {"ok": True, "item": item}
 
+    if cmd == "read_dids":
+        # Batched read_did: one round-trip for a whole DID list (TUI live polling).
+        ecu = request.get("ecu")
+        if not isinstance(ecu, str):
+            return error("ecu must be hex string")
+        dids_raw = request.get("dids")
+        if not isinstance(dids_raw, list):
+            return error("dids must be a list of hex strings")
+        try:
+            did_ints = [parse_did(d) for d in dids_raw]
+        except Exception:
+            return error("did must be hex string")
+        items = service.read_dids(ecu, did_ints)
+        return {"ok": True, "items": items}
+
     return error("unknown cmd")
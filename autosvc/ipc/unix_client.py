@@ -8,6 +8,11 @@ from typing import Any
 
 log = logging.getLogger(__name__)
 
+# Large enough for a multi-ECU scan/topology response in one read.
+_RCVBUF = 1 << 20
+
+_ENCODE = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+
 
 class UnixJsonlClient:
     def __init__(self, socket_path: str, *, timeout_s: float = 2.0) -> None:
@@ -17,19 +22,55 @@ class UnixJsonlClient:
     def request(self, payload: dict[str, Any]) -> dict[str, Any]:
         cmd = payload.get("cmd")
         log.debug("IPC request", extra={"cmd": cmd, "sock": self._socket_path})
-        data = (json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+        data = _ENCODE(payload).encode("ascii") + b"\n"
+        raw = self._exchange(data, 1, cmd)[0]
+        log.debug("IPC response", extra={"cmd": cmd, "ok": raw.get("ok")})
+        return raw
+
+    def request_many(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Pipeline several requests over one connection; responses come back in request order."""
+        if not payloads:
+            return []
+        cmd = payloads[0].get("cmd")
+        log.debug("IPC request", extra={"cmd": cmd, "count": len(payloads), "sock": self._socket_path})
+        data = b"".join(_ENCODE(p).encode("ascii") + b"\n" for p in payloads)
+        return self._exchange(data, len(payloads), cmd)
+
+    def _exchange(self, data: bytes, count: int, cmd: Any) -> list[dict[str, Any]]:
+        try:
+            lines = self._roundtrip(data, count)
+        except BrokenPipeError:
+            # The daemon dropped us before reading the request (e.g. it was restarting); one fresh try.
+            log.debug("IPC reconnect", extra={"cmd": cmd, "sock": self._socket_path})
+            lines = self._roundtrip(data, count)
+        if len(lines) < count:
+            raise RuntimeError("no response")
+        out: list[dict[str, Any]] = []
+        for line in lines:
+            raw = json.loads(line)
+            if not isinstance(raw, dict):
+                raise RuntimeError("invalid response")
+            out.append(raw)
+        return out
+
+    def _roundtrip(self, data: bytes, count: int) -> list[bytearray]:
+        # One connection per request batch: the daemon serves a single client at a time, so holding
+        # a connection open would block every other client. It answers pipelined lines in order.
         with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RCVBUF)
+            except OSError:
+                pass
             sock.settimeout(self._timeout_s)
             sock.connect(self._socket_path)
             sock.sendall(data)
-            fileobj = sock.makefile("rb")
-            with fileobj:
-                line = fileobj.readline()
-        if not line:
-            raise RuntimeError("no response")
-        raw = json.loads(line.decode("utf-8"))
-        if not isinstance(raw, dict):
-            raise RuntimeError("invalid response")
-        log.debug("IPC response", extra={"cmd": cmd, "ok": raw.get("ok")})
-        return raw
-
+            buf = bytearray()
+            seen = 0
+            while seen < count:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                seen += chunk.count(b"\n")
+                buf += chunk
+        # Complete lines only; a truncated tail is reported as a missing response.
+        return buf.split(b"\n")[: min(seen, count)]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import select
 import socket
 import time
 from typing import Any
@@ -20,20 +21,38 @@ class JsonlUnixServer:
         self._socket_path = socket_path
         self._service = service
         self._sock: socket.socket | None = None
+        # shutdown() writes to this pair to wake any select() in the serve loop.
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_w.setblocking(False)
+        self._stopping = False
 
     def serve_forever(self) -> None:
         if self._sock is None:
             self._start()
         assert self._sock is not None
         log.info("IPC server ready", extra={"sock": self._socket_path})
-        while True:
+        while not self._stopping:
+            ready, _, _ = select.select([self._sock, self._wakeup_r], [], [])
+            if self._sock not in ready:
+                continue
             conn, addr = self._sock.accept()
             _ = addr
             with conn:
                 log.info("IPC client connected", extra={"sock": self._socket_path})
                 self._handle_client(conn)
+        log.info("IPC server stopped", extra={"sock": self._socket_path})
+
+    def shutdown(self) -> None:
+        """Ask serve_forever() to return; safe to call from a signal handler."""
+        self._stopping = True
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            pass
 
     def close(self) -> None:
+        self._wakeup_r.close()
+        self._wakeup_w.close()
         if self._sock is not None:
             try:
                 self._sock.close()
@@ -55,75 +74,68 @@ class JsonlUnixServer:
         log.info("IPC server listening", extra={"sock": self._socket_path})
 
     def _handle_client(self, conn: socket.socket) -> None:
-        # Use socket timeouts to allow watch streaming without threads.
-        conn.settimeout(1.0)
-        fileobj = conn.makefile("rwb")
-        with fileobj:
-            watcher: Watcher | None = None
-            tick_ms = 200
-            max_ticks: int | None = None
-            tick = 0
+        # The socket stays blocking; select() timeouts in _LineReader pace watch ticks without threads.
+        reader = _LineReader(conn, self._wakeup_r)
+        watcher: Watcher | None = None
+        tick_ms = 200
+        max_ticks: int | None = None
+        tick = 0
 
+        while True:
+            if watcher is None:
+                line = reader.readline(None)
+                if not line:
+                    break
+                response, watcher, tick_ms, max_ticks = self._handle_line(line)
+                _send_lines(conn, [response])
+                tick = 0
+                continue
+
+            # Watch streaming mode:
+            tick += 1
+            try:
+                events = watcher.tick(tick)
+            except Exception as exc:
+                _send_lines(conn, [encode_json_line(error(str(exc)))])
+                watcher = None
+                continue
+
+            # A tick's events (and the final "done") go out in one send.
+            out = [encode_json_line(evt.to_dict()) for evt in events]
+            done = max_ticks is not None and tick >= max_ticks
+            if done:
+                out.append(encode_json_line({"ok": True, "done": True}))
+            if out:
+                try:
+                    _send_lines(conn, out)
+                except OSError:
+                    return None
+            if done:
+                watcher = None
+                continue
+
+            # Wait for watch_stop (or other commands) while respecting tick_ms.
+            deadline = time.monotonic() + (max(0, int(tick_ms)) / 1000.0)
             while True:
-                if watcher is None:
-                    conn.settimeout(None)
-                    line = fileobj.readline()
-                    if not line:
-                        break
-                    response, watcher, tick_ms, max_ticks = self._handle_line(line)
-                    fileobj.write(response)
-                    fileobj.flush()
-                    tick = 0
-                    continue
-
-                # Watch streaming mode:
-                tick += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                line = reader.readline(remaining)
+                if line is None:
+                    break
+                if not line:
+                    return None
                 try:
-                    events = watcher.tick(tick)
-                except Exception as exc:
-                    fileobj.write(encode_json_line(error(str(exc))))
-                    fileobj.flush()
-                    watcher = None
+                    req = decode_json_line(line)
+                except ValueError as exc:
+                    _send_lines(conn, [encode_json_line(error(str(exc)))])
                     continue
-
-                for evt in events:
-                    try:
-                        fileobj.write(encode_json_line(evt.to_dict()))
-                        fileobj.flush()
-                    except OSError:
-                        return None
-
-                if max_ticks is not None and tick >= max_ticks:
-                    fileobj.write(encode_json_line({"ok": True, "done": True}))
-                    fileobj.flush()
+                cmd = req.get("cmd")
+                if cmd == "watch_stop":
+                    _send_lines(conn, [encode_json_line({"ok": True, "stopped": True})])
                     watcher = None
-                    continue
-
-                # Wait for watch_stop (or other commands) while respecting tick_ms.
-                deadline = time.monotonic() + (max(0, int(tick_ms)) / 1000.0)
-                while time.monotonic() < deadline:
-                    remaining = max(0.0, deadline - time.monotonic())
-                    conn.settimeout(min(0.1, remaining))
-                    try:
-                        line = fileobj.readline()
-                    except socket.timeout:
-                        continue
-                    if not line:
-                        return None
-                    try:
-                        req = decode_json_line(line)
-                    except ValueError as exc:
-                        fileobj.write(encode_json_line(error(str(exc))))
-                        fileobj.flush()
-                        continue
-                    cmd = req.get("cmd")
-                    if cmd == "watch_stop":
-                        fileobj.write(encode_json_line({"ok": True, "stopped": True}))
-                        fileobj.flush()
-                        watcher = None
-                        break
-                    fileobj.write(encode_json_line(error("watch active; only watch_stop is accepted")))
-                    fileobj.flush()
+                    break
+                _send_lines(conn, [encode_json_line(error("watch active; only watch_stop is accepted"))])
 
     def _handle_line(
         self, line: bytes
@@ -175,3 +187,49 @@ class JsonlUnixServer:
         max_ticks = int(max_ticks_raw) if max_ticks_raw is not None else None
         watcher = Watcher(self._service, items=items, emit_mode=emit, tick_ms=tick_ms)
         return watcher, tick_ms, max_ticks
+
+
+class _LineReader:
+    """Newline-delimited reads from a blocking socket with an optional wait limit."""
+
+    def __init__(self, conn: socket.socket, wakeup: socket.socket) -> None:
+        self._conn = conn
+        self._wakeup = wakeup
+        self._buf = bytearray()
+
+    def readline(self, timeout: float | None) -> bytes | None:
+        """Return the next line, b"" on EOF or server shutdown, or None if `timeout` passes first."""
+        while True:
+            end = self._buf.find(b"\n")
+            if end >= 0:
+                line = bytes(self._buf[: end + 1])
+                del self._buf[: end + 1]
+                return line
+            ready, _, _ = select.select([self._conn, self._wakeup], [], [], timeout)
+            if not ready:
+                return None
+            if self._wakeup in ready:
+                return b""
+            chunk = self._conn.recv(65536)
+            if not chunk:
+                line = bytes(self._buf)
+                self._buf.clear()
+                return line
+            self._buf.extend(chunk)
+
+
+# Keep sendmsg iovecs well below IOV_MAX (1024 on Linux).
+_MAX_IOV = 512
+
+
+def _send_lines(conn: socket.socket, lines: list[bytes]) -> None:
+    # Encoded JSONL lines go out as one scatter-gather send instead of being joined or flushed one by one.
+    if len(lines) == 1:
+        conn.sendall(lines[0])
+        return
+    if len(lines) > _MAX_IOV or not hasattr(conn, "sendmsg"):
+        conn.sendall(b"".join(lines))
+        return
+    sent = conn.sendmsg(lines)
+    if sent < sum(map(len, lines)):
+        conn.sendall(b"".join(lines)[sent:])
@@ -24,12 +24,33 @@ if not hasattr(logging.Logger, "trace"):
     logging.Logger.trace = _logger_trace  # type: ignore[attr-defined]
 
 
-_trace_id_var: contextvars.ContextVar[str | None] = contextvars.ContextVar("autosvc_trace_id", default=None)
+class LazyTraceId:
+    """A trace id that is generated on first use.
+
+    Most CLI runs never render a log record, so avoid the urandom read.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        self._value: str | None = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            import uuid
+
+            self._value = uuid.uuid4().hex[:12]
+        return self._value
+
+
+_trace_id_var: contextvars.ContextVar[str | LazyTraceId | None] = contextvars.ContextVar(
+    "autosvc_trace_id", default=None
+)
 
 
 @contextlib.contextmanager
-def trace_context(trace_id: str) -> Any:
-    token = _trace_id_var.set(str(trace_id))
+def trace_context(trace_id: str | LazyTraceId) -> Any:
+    token = _trace_id_var.set(trace_id if isinstance(trace_id, LazyTraceId) else str(trace_id))
     try:
         yield
     finally:
@@ -37,7 +58,8 @@ def trace_context(trace_id: str) -> Any:
 
 
 def get_trace_id() -> str | None:
-    return _trace_id_var.get()
+    value = _trace_id_var.get()
+    return None if value is None else str(value)
 
 
 class _ContextFilter(logging.Filter):
@@ -197,7 +219,8 @@ def setup_logging(
     if log_file:
         path = os.path.expanduser(str(log_file))
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-        fh = logging.FileHandler(path, encoding="utf-8")
+        # delay: the file is opened on the first emitted record, not during startup.
+        fh = logging.FileHandler(path, encoding="utf-8", delay=True)
         fh.setFormatter(file_formatter)
         fh.addFilter(_ContextFilter())
         handlers.append(fh)
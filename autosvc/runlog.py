@@ -8,7 +8,7 @@ import platform
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TextIO
+from typing import BinaryIO, TextIO
 
 
 @dataclass(frozen=True)
@@ -19,28 +19,71 @@ class RunLogPaths:
     metadata_path: Path
 
 
+class _TeeBuffer:
+    """Byte-level tee: one encoded payload, written to both sinks."""
+
+    def __init__(self, primary: BinaryIO, secondary: BinaryIO) -> None:
+        self._primary = primary
+        self._secondary = secondary
+
+    def write(self, data: bytes) -> int:
+        n = self._primary.write(data)
+        self._secondary.write(data)
+        return len(data) if n is None else n
+
+    def flush(self) -> None:
+        self._primary.flush()
+        self._secondary.flush()
+
+
 class TeeTextIO(io.TextIOBase):
     """A minimal tee for text output.
 
     Used to capture stdout to a file without changing the CLI output.
+    Text is encoded once and the bytes go to the primary's binary buffer and
+    to the secondary (a file opened in binary mode). `.buffer` exposes the
+    byte tee for callers that already have encoded output. A primary without
+    a binary buffer (e.g. io.StringIO) gets text instead, and `.buffer` is
+    then absent.
     """
 
-    def __init__(self, primary: TextIO, secondary: TextIO) -> None:
+    def __init__(self, primary: TextIO, secondary: BinaryIO) -> None:
+        # Anything already buffered in the text layer must go out first.
+        primary.flush()
         self._primary = primary
+        self._encoding = getattr(primary, "encoding", None) or "utf-8"
+        self._errors = getattr(primary, "errors", None) or "strict"
         self._secondary = secondary
+        raw = getattr(primary, "buffer", None)
+        self._buffer = _TeeBuffer(raw, secondary) if raw is not None else None
 
     @property
     def encoding(self) -> str | None:  # pragma: no cover
-        return getattr(self._primary, "encoding", None)
+        return self._encoding
+
+    @property
+    def buffer(self) -> _TeeBuffer:
+        if self._buffer is None:
+            raise AttributeError("buffer")
+        return self._buffer
+
+    def isatty(self) -> bool:
+        return self._primary.isatty()
 
     def write(self, s: str) -> int:
-        n = self._primary.write(s)
-        self._secondary.write(s)
-        return n
+        if self._buffer is None:
+            self._primary.write(s)
+            self._secondary.write(s.encode(self._encoding, self._errors))
+        else:
+            self._buffer.write(s.encode(self._encoding, self._errors))
+        return len(s)
 
     def flush(self) -> None:
-        self._primary.flush()
-        self._secondary.flush()
+        if self._buffer is None:
+            self._primary.flush()
+            self._secondary.flush()
+        else:
+            self._buffer.flush()
 
 
 def create_run_log_dir(base_dir: str, *, trace_id: str, argv: list[str]) -> RunLogPaths:
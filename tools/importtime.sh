@@ -0,0 +1,78 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Startup import budget check for the CLI.
+#
+# Runs cheap CLI paths under `python -X importtime` and fails if any of them
+# pulls in the diagnostic stack (python-can, UDS, IPC) at import time.
+#
+# Usage:
+#   tools/importtime.sh [OUT_DIR]
+#
+# If OUT_DIR is given, raw importtime logs are kept there (one per case) and can be
+# visualized with `tuna OUT_DIR/<case>.log`.
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+OUT_DIR="${1:-}"
+
+export UV_CACHE_DIR="${UV_CACHE_DIR:-/tmp/uv-cache}"
+
+TMP_DIR="$(mktemp -d)"
+cleanup() {
+  rm -rf "${TMP_DIR}"
+}
+trap cleanup EXIT INT TERM
+
+if [[ -n "${OUT_DIR}" ]]; then
+  mkdir -p "${OUT_DIR}"
+fi
+
+HEAVY_ALL="autosvc.core.service autosvc.core.transport.socketcan autosvc.core.live.watch can"
+
+run_case() {
+  local name="$1"
+  local forbidden="$2"
+  shift 2
+
+  local log="${TMP_DIR}/${name}.log"
+  (cd "${ROOT_DIR}" && uv run python -X importtime -m autosvc.apps.cli "$@") >/dev/null 2>"${log}" || true
+  if [[ -n "${OUT_DIR}" ]]; then
+    cp "${log}" "${OUT_DIR}/${name}.log"
+  fi
+
+  python3 - "${log}" "${name}" ${forbidden} <<'PY'
+import sys
+
+log_path, name, *forbidden = sys.argv[1:]
+loaded = set()
+total_us = 0
+for line in open(log_path, "r", encoding="utf-8", errors="replace"):
+    if not line.startswith("import time:"):
+        continue
+    parts = line.split("|")
+    if len(parts) != 3:
+        continue
+    module = parts[2].strip()
+    if module == "package":
+        continue
+    loaded.add(module)
+    try:
+        total_us += int(parts[0].split(":", 1)[1].strip())
+    except ValueError:
+        pass
+
+bad = sorted(m for m in forbidden if m in loaded)
+if bad:
+    print(f"FAIL {name}: imported {', '.join(bad)}")
+    raise SystemExit(1)
+print(f"OK {name} ({total_us / 1000.0:.1f} ms self import time, {len(loaded)} modules)")
+PY
+}
+
+ok=0
+run_case "help" "${HEAVY_ALL} autosvc.ipc.unix_client socket" --help || ok=1
+run_case "unsafe_status" "${HEAVY_ALL} autosvc.ipc.unix_client socket" unsafe status || ok=1
+run_case "connect_scan" "${HEAVY_ALL}" --connect "${TMP_DIR}/missing.sock" scan || ok=1
+run_case "connect_did_read" "${HEAVY_ALL}" --connect "${TMP_DIR}/missing.sock" did read --ecu 01 --did F190 || ok=1
+
+exit "${ok}"